@@ -12,23 +12,41 @@ import asyncio
 import contextlib
 import logging
 import os
+import time
 import uuid
-from collections.abc import MutableMapping
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from dataclasses import dataclass
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel
 
-from server.config import get_settings
-from server.services.auth import get_auth_service
+from server.handlers.auth import require_auth
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(slots=True)
+class SessionInfo:
+    """Timestamps for a tracked chat session (time.monotonic_ns() values)."""
+
+    created_at: int
+    last_used: int
+
+
 # Simple in-memory session tracking
-# Key: session_id, Value: (created_at, last_used)
-# Sessions older than SESSION_TTL are considered new
-SESSION_TTL = timedelta(hours=24)
-_active_sessions: MutableMapping[str, tuple[datetime, datetime]] = {}
+# Key: session_id, Value: SessionInfo
+# Sessions older than SESSION_TTL_NS are considered new
+# Kept in least-recently-used order so expired entries are always at the front
+SESSION_TTL_NS = 24 * 60 * 60 * 1_000_000_000  # 24 hours
+_active_sessions: OrderedDict[str, SessionInfo] = OrderedDict()
+
+# Expired sessions are swept at most once per interval rather than on every request
+CLEANUP_INTERVAL_NS = 60 * 1_000_000_000  # 1 minute
+_last_cleanup = 0
+
+# last_used is only refreshed once it is this stale; against a 24h TTL the
+# coarser timestamp (and LRU order) makes no practical difference
+TOUCH_INTERVAL_NS = 60 * 1_000_000_000  # 1 minute
 
 router = APIRouter(prefix="/api", tags=["chat"])
 
@@ -38,11 +56,11 @@ def _is_existing_session(session_id: str) -> bool:
 
     Returns True if the session exists and hasn't expired.
     """
-    if session_id not in _active_sessions:
+    info = _active_sessions.get(session_id)
+    if info is None:
         return False
 
-    _created_at, last_used = _active_sessions[session_id]
-    if datetime.now() - last_used > SESSION_TTL:
+    if time.monotonic_ns() - info.last_used > SESSION_TTL_NS:
         # Session expired, remove it
         del _active_sessions[session_id]
         return False
@@ -50,35 +68,41 @@ def _is_existing_session(session_id: str) -> bool:
     return True
 
 
-def _register_session(session_id: str) -> None:
-    """Register a new session or update last_used time for existing one."""
-    now = datetime.now()
-    if session_id in _active_sessions:
-        created_at, _ = _active_sessions[session_id]
-        _active_sessions[session_id] = (created_at, now)
+def _register_session(session_id: str, *, is_new: bool = False) -> None:
+    """Register a new session or update last_used time for existing one.
+
+    Pass is_new=True for a freshly generated ID to skip the existing-entry lookup.
+    """
+    now = time.monotonic_ns()
+    info = None if is_new else _active_sessions.get(session_id)
+    if info is not None:
+        if now - info.last_used >= TOUCH_INTERVAL_NS:
+            info.last_used = now
+            _active_sessions.move_to_end(session_id)
     else:
-        _active_sessions[session_id] = (now, now)
+        _active_sessions[session_id] = SessionInfo(created_at=now, last_used=now)
 
 
 def _cleanup_expired_sessions() -> None:
-    """Remove expired sessions from tracking."""
-    now = datetime.now()
-    expired = [
-        sid for sid, (_, last_used) in _active_sessions.items() if now - last_used > SESSION_TTL
-    ]
-    for sid in expired:
-        del _active_sessions[sid]
-
+    """Remove expired sessions from tracking.
 
-def _require_auth(request: Request) -> None:
-    """Verify user is authenticated via session cookie."""
-    auth = get_auth_service()
-    token = request.cookies.get("aipa_session")
-    if not token or not auth.verify_session(token):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-        )
+    Sessions are ordered by last use, so this stops at the first live entry.
+    """
+    now = time.monotonic_ns()
+    while _active_sessions:
+        oldest = next(iter(_active_sessions.values()))
+        if now - oldest.last_used <= SESSION_TTL_NS:
+            break
+        _active_sessions.popitem(last=False)
+
+
+def _maybe_cleanup_expired_sessions() -> None:
+    """Run the expired-session sweep if CLEANUP_INTERVAL_NS has elapsed since the last one."""
+    global _last_cleanup
+    now = time.monotonic_ns()
+    if now - _last_cleanup > CLEANUP_INTERVAL_NS:
+        _cleanup_expired_sessions()
+        _last_cleanup = now
 
 
 class ChatRequest(BaseModel):
@@ -98,6 +122,8 @@ class ChatResponse(BaseModel):
 class CancellableClaudeProcess:
     """Wrapper for a cancellable Claude CLI process."""
 
+    __slots__ = ("process", "cancelled")
+
     def __init__(self) -> None:
         self.process: asyncio.subprocess.Process | None = None
         self.cancelled = False
@@ -118,8 +144,56 @@ class CancellableClaudeProcess:
                 pass  # Process already ended
 
 
-# Track active processes for cancellation on disconnect
-_active_processes: dict[str, CancellableClaudeProcess] = {}
+# Track active processes for cancellation on disconnect (oldest first)
+# Entries are removed when call_claude_code finishes; the cap only matters if
+# requests are abandoned without unwinding (e.g. a hard-killed task)
+MAX_ACTIVE_PROCESSES = 512
+_active_processes: OrderedDict[str, CancellableClaudeProcess] = OrderedDict()
+# The event loop only keeps weak references to tasks, so hold eviction
+# cancellations here until they finish terminating their process
+_eviction_tasks: set[asyncio.Task] = set()
+
+
+def _track_process(request_id: str, wrapper: CancellableClaudeProcess) -> None:
+    """Register a process for cancellation, evicting stale entries past the cap."""
+    _active_processes[request_id] = wrapper
+    if len(_active_processes) <= MAX_ACTIVE_PROCESSES:
+        return
+
+    # Drop entries whose process has already exited
+    finished = [
+        rid
+        for rid, w in _active_processes.items()
+        if w.process is not None and w.process.returncode is not None
+    ]
+    for rid in finished:
+        del _active_processes[rid]
+
+    # Still over the cap: cancel the oldest requests
+    while len(_active_processes) > MAX_ACTIVE_PROCESSES:
+        old_id, old_wrapper = _active_processes.popitem(last=False)
+        logger.warning(f"Evicting abandoned request {old_id[:8]}")
+        task = asyncio.create_task(old_wrapper.cancel())
+        _eviction_tasks.add(task)
+        task.add_done_callback(_eviction_tasks.discard)
+
+
+# Base environment for CLI subprocesses, copied from os.environ on first use
+_base_env: dict[str, str] | None = None
+
+
+def _subprocess_env(oauth_token: str | None = None) -> dict[str, str]:
+    """Get the environment for a Claude CLI subprocess.
+
+    The base copy of os.environ is shared across requests (subprocesses don't
+    mutate it); a new dict is only built when overriding the OAuth token.
+    """
+    global _base_env
+    if _base_env is None:
+        _base_env = os.environ.copy()
+    if oauth_token and oauth_token != _base_env.get("CLAUDE_CODE_OAUTH_TOKEN"):
+        return {**_base_env, "CLAUDE_CODE_OAUTH_TOKEN": oauth_token}
+    return _base_env
 
 
 async def call_claude_code(
@@ -144,14 +218,15 @@ async def call_claude_code(
     Returns:
         Tuple of (response text, session_id used)
     """
-    # Generate session ID if not provided
-    if not session_id:
+    # Generate session ID if not provided (a fresh ID can't be an existing session)
+    is_new = not session_id
+    if is_new:
         session_id = str(uuid.uuid4())
 
     # Create cancellable wrapper
     req_id = request_id or str(uuid.uuid4())
     wrapper = CancellableClaudeProcess()
-    _active_processes[req_id] = wrapper
+    _track_process(req_id, wrapper)
 
     # Build CLI command with dangerous mode for full tool access
     # Note: This is safe because:
@@ -168,7 +243,7 @@ async def call_claude_code(
 
     # Add session management flags
     # --session-id for new sessions, --resume for continuing
-    if _is_existing_session(session_id):
+    if not is_new and _is_existing_session(session_id):
         cmd.extend(["--resume", session_id])
         logger.info(f"Resuming existing session: {session_id[:8]}...")
     else:
@@ -176,10 +251,7 @@ async def call_claude_code(
         logger.info(f"Starting new session: {session_id[:8]}...")
 
     # Set up environment with OAuth token
-    env = os.environ.copy()
-    token = oauth_token or os.getenv("CLAUDE_CODE_OAUTH_TOKEN")
-    if token:
-        env["CLAUDE_CODE_OAUTH_TOKEN"] = token
+    env = _subprocess_env(oauth_token)
 
     # Use /workspace by default to pick up production agent config
     cwd = working_dir or os.getenv("WORKSPACE", "/workspace")
@@ -210,18 +282,18 @@ async def call_claude_code(
             raise asyncio.CancelledError("Request cancelled during processing")
 
         if wrapper.process.returncode != 0:
-            error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
+            error_msg = stderr.decode("utf-8", "replace") if stderr else "Unknown error"
             logger.error(f"Claude Code CLI error: {error_msg}")
             raise RuntimeError(f"Agent error: {error_msg}")
 
-        response = stdout.decode("utf-8").strip()
+        response = stdout.decode("utf-8", "replace").strip()
         logger.info(f"Claude Code response length: {len(response)}")
 
         # Register session for future continuation
-        _register_session(session_id)
+        _register_session(session_id, is_new=is_new)
 
         # Periodically clean up expired sessions
-        _cleanup_expired_sessions()
+        _maybe_cleanup_expired_sessions()
 
         return response, session_id
 
@@ -248,11 +320,15 @@ async def cancel_request(request_id: str) -> None:
 
 
 @router.post("/chat", response_model=ChatResponse)
-async def chat(request: Request, body: ChatRequest) -> ChatResponse:
+async def chat(
+    request: Request,
+    body: ChatRequest,
+    _auth: bool = Depends(require_auth),
+) -> Response:
     """Send a text message to the agent and get a response.
 
     Requires authentication via session cookie.
-    Can be disabled in production via ENABLE_CHAT_API=false.
+    Only mounted in production when ENABLE_CHAT_API=true (see server.main).
     Automatically cancels if client disconnects (browser closed/refreshed).
 
     Args:
@@ -262,30 +338,22 @@ async def chat(request: Request, body: ChatRequest) -> ChatResponse:
     Returns:
         ChatResponse with agent's response and session_id
     """
-    settings = get_settings()
-
-    # Check if endpoint is enabled
-    if settings.is_production and not settings.enable_chat_api:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Not found",
-        )
-
-    # Require authentication
-    _require_auth(request)
-
     # Generate request ID for cancellation tracking
     request_id = str(uuid.uuid4())
 
     # Start disconnect monitoring in background
     async def check_disconnect() -> None:
-        """Monitor for client disconnect and cancel if needed."""
-        while request_id in _active_processes:
-            if await request.is_disconnected():
+        """Wait for the client to disconnect and cancel the request if it does.
+
+        The request body has already been read, so the next ASGI message is
+        http.disconnect; this blocks until then instead of polling.
+        """
+        while True:
+            message = await request.receive()
+            if message["type"] == "http.disconnect":
                 logger.info(f"Client disconnected, cancelling request {request_id[:8]}")
                 await cancel_request(request_id)
-                break
-            await asyncio.sleep(0.5)  # Check every 500ms
+                return
 
     disconnect_task = asyncio.create_task(check_disconnect())
 
@@ -311,4 +379,9 @@ async def chat(request: Request, body: ChatRequest) -> ChatResponse:
         with contextlib.suppress(asyncio.CancelledError):
             await disconnect_task
 
-    return ChatResponse(response=response, session_id=session_id)
+    # Serialize with pydantic-core directly (the reply can be many KB); returning a
+    # Response skips FastAPI's jsonable_encoder + json.dumps round trip
+    return Response(
+        content=ChatResponse(response=response, session_id=session_id).model_dump_json(),
+        media_type="application/json",
+    )
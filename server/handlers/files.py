@@ -1,20 +1,54 @@
 """File server for workspace files with visual UI."""
 
+import errno
+import itertools
 import mimetypes
+import os
+import secrets
+import shutil
+import stat
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO
 
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
-from fastapi.responses import FileResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 
 from server.config import Settings, get_settings
-from server.handlers.auth import require_auth_redirect
-from server.models.requests import FileInfo
-from server.services.auth import get_auth_service
+from server.handlers.auth import require_auth, require_auth_redirect
+from server.models.requests import CreateFolderRequest, FileInfo
 
 router = APIRouter()
 templates = Jinja2Templates(directory="server/templates")
+# Templates only change on deploy in production, so skip Jinja2's per-render
+# mtime check there; compile files.html now rather than on the first request
+templates.env.auto_reload = not get_settings().is_production
+templates.get_template("files.html")
+
+# Uploads are copied to disk in chunks of this size rather than read into memory
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Directory listings keyed by resolved path: (dir mtime_ns, expires_at, entries),
+# least recently used first. Adding, removing or renaming an entry bumps the
+# directory's mtime; rewriting a file in place doesn't, so the TTL bounds how
+# long a listing can show a stale size or modified time.
+LISTING_CACHE_TTL = 5.0  # seconds
+LISTING_CACHE_MAX_ENTRIES = 256
+LISTING_RACY_NS = 1_000_000_000  # 1 second
+_listing_cache: OrderedDict[str, tuple[int, float, list[FileInfo]]] = OrderedDict()
+_listing_cache_lock = threading.Lock()
+
+
+def _is_within(target: str, root: str) -> bool:
+    """Check a resolved path is root itself or below it (on a separator boundary)."""
+    return target == root or target.startswith(os.path.join(root, ""))
 
 
 def validate_path_within(target: Path, root: Path) -> Path:
@@ -22,7 +56,7 @@ def validate_path_within(target: Path, root: Path) -> Path:
 
     Args:
         target: The target path to validate
-        root: The root directory that target must be within
+        root: The (already resolved) root directory that target must be within
 
     Returns:
         The resolved target path
@@ -30,12 +64,16 @@ def validate_path_within(target: Path, root: Path) -> Path:
     Raises:
         HTTPException: 400 for invalid paths, 403 for access denied
     """
+    # An empty relative path joins back to the root, which is already resolved;
+    # skip realpath's per-component lstat for this common landing-page case
+    if target == root:
+        return root
+
     try:
-        resolved_target = target.resolve()
-        resolved_root = root.resolve()
-        if not str(resolved_target).startswith(str(resolved_root)):
+        resolved_target = os.path.realpath(target)
+        if not _is_within(resolved_target, str(root)):
             raise HTTPException(status_code=403, detail="Access denied")
-        return resolved_target
+        return Path(resolved_target)
     except HTTPException:
         raise
     except Exception:
@@ -47,69 +85,132 @@ def get_files_path(settings: Settings = Depends(get_settings)) -> Path:
     return Path(settings.workspace_path) / "files"
 
 
+@lru_cache(maxsize=1)
+def _resolve_files_root(workspace_path: str) -> Path:
+    """Resolve the files directory once per workspace path."""
+    return (Path(workspace_path) / "files").resolve()
+
+
+def get_files_root(settings: Settings) -> Path:
+    """Get the resolved files directory path (resolved once, then cached)."""
+    return _resolve_files_root(settings.workspace_path)
+
+
+# File extension → Material icon name
+ICON_MAP: dict[str, str] = {
+    # Documents
+    ".pdf": "picture_as_pdf",
+    ".doc": "description",
+    ".docx": "description",
+    ".txt": "article",
+    ".md": "article",
+    ".rtf": "description",
+    # Spreadsheets
+    ".xls": "table_chart",
+    ".xlsx": "table_chart",
+    ".csv": "table_chart",
+    # Presentations
+    ".ppt": "slideshow",
+    ".pptx": "slideshow",
+    # Images
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".png": "image",
+    ".gif": "image",
+    ".svg": "image",
+    ".webp": "image",
+    ".ico": "image",
+    # Videos
+    ".mp4": "movie",
+    ".mov": "movie",
+    ".avi": "movie",
+    ".mkv": "movie",
+    ".webm": "movie",
+    # Audio
+    ".mp3": "audio_file",
+    ".wav": "audio_file",
+    ".ogg": "audio_file",
+    ".m4a": "audio_file",
+    ".flac": "audio_file",
+    # Code
+    ".py": "code",
+    ".js": "code",
+    ".ts": "code",
+    ".html": "code",
+    ".css": "code",
+    ".json": "data_object",
+    ".xml": "code",
+    ".yaml": "data_object",
+    ".yml": "data_object",
+    # Archives
+    ".zip": "folder_zip",
+    ".tar": "folder_zip",
+    ".gz": "folder_zip",
+    ".rar": "folder_zip",
+    ".7z": "folder_zip",
+    # Data
+    ".sql": "storage",
+    ".db": "storage",
+    ".sqlite": "storage",
+}
+
+# File extension → human-readable file type
+DESC_MAP: dict[str, str] = {
+    ".pdf": "PDF Document",
+    ".doc": "Word Document",
+    ".docx": "Word Document",
+    ".txt": "Text File",
+    ".md": "Markdown",
+    ".rtf": "Rich Text",
+    ".xls": "Excel Spreadsheet",
+    ".xlsx": "Excel Spreadsheet",
+    ".csv": "CSV Data",
+    ".ppt": "Presentation",
+    ".pptx": "Presentation",
+    ".jpg": "JPEG Image",
+    ".jpeg": "JPEG Image",
+    ".png": "PNG Image",
+    ".gif": "GIF Image",
+    ".svg": "SVG Vector",
+    ".webp": "WebP Image",
+    ".mp4": "MP4 Video",
+    ".mov": "QuickTime Video",
+    ".avi": "AVI Video",
+    ".mp3": "MP3 Audio",
+    ".wav": "WAV Audio",
+    ".py": "Python Script",
+    ".js": "JavaScript",
+    ".ts": "TypeScript",
+    ".html": "HTML Document",
+    ".css": "Stylesheet",
+    ".json": "JSON Data",
+    ".yaml": "YAML Config",
+    ".yml": "YAML Config",
+    ".zip": "ZIP Archive",
+    ".tar": "TAR Archive",
+    ".gz": "Compressed File",
+}
+
+# Content types for the extensions the browser knows about, resolved once here
+# instead of through mimetypes.guess_type on every download
+MIME_MAP: dict[str, str] = {
+    ext: mime_type
+    for ext in ICON_MAP.keys() | DESC_MAP.keys()
+    if (mime_type := mimetypes.guess_type(f"file{ext}")[0])
+}
+
+
+def _file_ext(name: str) -> str:
+    """Get the lowercased extension of a file name (without building a Path)."""
+    return os.path.splitext(name)[1].lower()
+
+
 def get_file_icon(name: str, is_dir: bool) -> str:
     """Get an appropriate icon for a file type."""
     if is_dir:
         return "folder"
 
-    ext = Path(name).suffix.lower()
-    icon_map = {
-        # Documents
-        ".pdf": "picture_as_pdf",
-        ".doc": "description",
-        ".docx": "description",
-        ".txt": "article",
-        ".md": "article",
-        ".rtf": "description",
-        # Spreadsheets
-        ".xls": "table_chart",
-        ".xlsx": "table_chart",
-        ".csv": "table_chart",
-        # Presentations
-        ".ppt": "slideshow",
-        ".pptx": "slideshow",
-        # Images
-        ".jpg": "image",
-        ".jpeg": "image",
-        ".png": "image",
-        ".gif": "image",
-        ".svg": "image",
-        ".webp": "image",
-        ".ico": "image",
-        # Videos
-        ".mp4": "movie",
-        ".mov": "movie",
-        ".avi": "movie",
-        ".mkv": "movie",
-        ".webm": "movie",
-        # Audio
-        ".mp3": "audio_file",
-        ".wav": "audio_file",
-        ".ogg": "audio_file",
-        ".m4a": "audio_file",
-        ".flac": "audio_file",
-        # Code
-        ".py": "code",
-        ".js": "code",
-        ".ts": "code",
-        ".html": "code",
-        ".css": "code",
-        ".json": "data_object",
-        ".xml": "code",
-        ".yaml": "data_object",
-        ".yml": "data_object",
-        # Archives
-        ".zip": "folder_zip",
-        ".tar": "folder_zip",
-        ".gz": "folder_zip",
-        ".rar": "folder_zip",
-        ".7z": "folder_zip",
-        # Data
-        ".sql": "storage",
-        ".db": "storage",
-        ".sqlite": "storage",
-    }
-    return icon_map.get(ext, "draft")
+    return ICON_MAP.get(_file_ext(name), "draft")
 
 
 def format_size(size: int) -> str:
@@ -152,43 +253,7 @@ def get_file_description(name: str, is_dir: bool, size: int) -> str:
     if is_dir:
         return "Folder"
 
-    ext = Path(name).suffix.lower()
-    desc_map = {
-        ".pdf": "PDF Document",
-        ".doc": "Word Document",
-        ".docx": "Word Document",
-        ".txt": "Text File",
-        ".md": "Markdown",
-        ".rtf": "Rich Text",
-        ".xls": "Excel Spreadsheet",
-        ".xlsx": "Excel Spreadsheet",
-        ".csv": "CSV Data",
-        ".ppt": "Presentation",
-        ".pptx": "Presentation",
-        ".jpg": "JPEG Image",
-        ".jpeg": "JPEG Image",
-        ".png": "PNG Image",
-        ".gif": "GIF Image",
-        ".svg": "SVG Vector",
-        ".webp": "WebP Image",
-        ".mp4": "MP4 Video",
-        ".mov": "QuickTime Video",
-        ".avi": "AVI Video",
-        ".mp3": "MP3 Audio",
-        ".wav": "WAV Audio",
-        ".py": "Python Script",
-        ".js": "JavaScript",
-        ".ts": "TypeScript",
-        ".html": "HTML Document",
-        ".css": "Stylesheet",
-        ".json": "JSON Data",
-        ".yaml": "YAML Config",
-        ".yml": "YAML Config",
-        ".zip": "ZIP Archive",
-        ".tar": "TAR Archive",
-        ".gz": "Compressed File",
-    }
-    return desc_map.get(ext, "File")
+    return DESC_MAP.get(_file_ext(name), "File")
 
 
 @router.get("/files-page")
@@ -211,15 +276,12 @@ async def files_page(
     except Exception:
         pass  # Sessions not available
 
-    return templates.TemplateResponse(
-        "files.html",
-        {
-            "request": request,
-            "agent_name": settings.agent_name,
-            "sessions": sessions,
-            "session_id": session_id,
-        },
+    html = templates.get_template("files.html").render(
+        agent_name=settings.agent_name,
+        sessions=sessions,
+        session_id=session_id,
     )
+    return HTMLResponse(html)
 
 
 # Legacy inline HTML removed - now using templates/files.html
@@ -231,133 +293,204 @@ async def list_files(
     settings: Settings = Depends(get_settings),
 ) -> list[FileInfo]:
     """List files in the workspace files directory."""
-    files_root = get_files_path(settings)
-    target_path = files_root / path
+    files_root = get_files_root(settings)
 
     # Security: ensure we stay within files directory
-    try:
-        target_path = target_path.resolve()
-        files_root = files_root.resolve()
-        if not str(target_path).startswith(str(files_root)):
-            raise HTTPException(status_code=403, detail="Access denied")
-    except HTTPException:
-        raise
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid path") from None
+    target_path = validate_path_within(files_root / path, files_root)
+
+    # One stat per entry adds up for large directories; keep it off the event loop
+    return await run_in_threadpool(_list_directory, target_path, files_root)
+
+
+def _list_directory(target_path: Path, files_root: Path) -> list[FileInfo]:
+    """Read a directory's entries as FileInfo, sorted by name (blocking).
 
-    if not target_path.exists():
+    Listings are reused while the directory's mtime is unchanged (see
+    LISTING_CACHE_TTL for the bound on per-file size/mtime staleness).
+    """
+    try:
+        dir_stat = os.stat(target_path)
+    except OSError:
         # Create files directory if it doesn't exist
-        if target_path == files_root:
-            target_path.mkdir(parents=True, exist_ok=True)
-        else:
-            raise HTTPException(status_code=404, detail="Path not found")
+        if target_path != files_root:
+            raise HTTPException(status_code=404, detail="Path not found") from None
+        target_path.mkdir(parents=True, exist_ok=True)
+        dir_stat = os.stat(target_path)
 
-    if not target_path.is_dir():
+    if not stat.S_ISDIR(dir_stat.st_mode):
         raise HTTPException(status_code=400, detail="Path is not a directory")
 
+    key = str(target_path)
+    now = time.monotonic()
+    with _listing_cache_lock:
+        cached = _listing_cache.get(key)
+        if cached and cached[0] == dir_stat.st_mtime_ns and cached[1] > now:
+            _listing_cache.move_to_end(key)
+            return list(cached[2])
+
+    files = _scan_directory(target_path, files_root)
+
+    # A directory modified within the timestamp granularity could change again
+    # without its mtime moving, so only cache listings of settled directories
+    if time.time_ns() - dir_stat.st_mtime_ns > LISTING_RACY_NS:
+        with _listing_cache_lock:
+            _listing_cache[key] = (dir_stat.st_mtime_ns, now + LISTING_CACHE_TTL, files)
+            _listing_cache.move_to_end(key)
+            while len(_listing_cache) > LISTING_CACHE_MAX_ENTRIES:
+                _listing_cache.popitem(last=False)
+
+    return list(files)
+
+
+def _scan_directory(target_path: Path, files_root: Path) -> list[FileInfo]:
+    """Stat every entry in a directory, sorted by name (blocking)."""
+    # scandir reuses the readdir entry type and caches each entry's stat
+    root_prefix = os.path.join(str(files_root), "")
+    with os.scandir(target_path) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
     files = []
-    for item in sorted(target_path.iterdir()):
+    for entry in entries:
         try:
-            stat = item.stat()
-            rel_path = str(item.relative_to(files_root))
+            st = entry.stat()
             files.append(
                 FileInfo(
-                    name=item.name,
-                    path=rel_path,
-                    size=stat.st_size if item.is_file() else 0,
-                    modified=datetime.fromtimestamp(stat.st_mtime),
-                    is_dir=item.is_dir(),
+                    name=entry.name,
+                    path=entry.path[len(root_prefix) :],
+                    size=st.st_size if entry.is_file() else 0,
+                    modified=datetime.fromtimestamp(st.st_mtime),
+                    is_dir=entry.is_dir(),
                 )
             )
-        except Exception:
+        except OSError:
             continue
 
     return files
 
 
+def _is_not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """Check the request's conditional headers against the file's current version.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag in tags or "*" in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return int(mtime) <= since.timestamp()
+
+    return False
+
+
 @router.get("/files/{file_path:path}")
 async def download_file(
     file_path: str,
+    request: Request,
     settings: Settings = Depends(get_settings),
-) -> FileResponse:
+) -> Response:
     """Download a file from the workspace."""
-    files_root = get_files_path(settings)
-    target_path = files_root / file_path
+    files_root = get_files_root(settings)
 
     # Security: ensure we stay within files directory
-    try:
-        target_path = target_path.resolve()
-        files_root = files_root.resolve()
-        if not str(target_path).startswith(str(files_root)):
-            raise HTTPException(status_code=403, detail="Access denied")
-    except HTTPException:
-        raise
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid path") from None
+    target_path = validate_path_within(files_root / file_path, files_root)
 
-    if not target_path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
+    # One stat answers exists/is_dir and is handed to FileResponse, which
+    # would otherwise stat the file again before sending it
+    try:
+        st = os.stat(target_path)
+    except OSError:
+        raise HTTPException(status_code=404, detail="File not found") from None
 
-    if target_path.is_dir():
+    if stat.S_ISDIR(st.st_mode):
         raise HTTPException(status_code=400, detail="Cannot download directory")
 
     # Determine content type
-    content_type, _ = mimetypes.guess_type(str(target_path))
+    content_type = MIME_MAP.get(_file_ext(target_path.name))
     if content_type is None:
-        content_type = "application/octet-stream"
+        content_type = mimetypes.guess_type(target_path.name)[0] or "application/octet-stream"
+
+    # Let the browser revalidate instead of downloading an unchanged file again
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    cache_headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+        "Cache-Control": "private, max-age=60",
+    }
+    if _is_not_modified(request, etag, st.st_mtime):
+        return Response(status_code=304, headers=cache_headers)
 
     return FileResponse(
         path=target_path,
         filename=target_path.name,
         media_type=content_type,
+        headers=cache_headers,
+        stat_result=st,
     )
 
 
+def _open_unique(target_dir: Path, filename: str) -> tuple[Path, BinaryIO]:
+    """Exclusively create a file in target_dir, renaming it if the name is taken.
+
+    Tries "name.ext", then "name_1.ext" ... "name_99.ext", then random suffixes.
+    O_EXCL creation makes each attempt a single syscall with no exists()/write race.
+    """
+    base, ext = os.path.splitext(filename)
+    numbered = (f"{base}_{n}{ext}" for n in range(1, 100))
+    for name in itertools.chain([filename], numbered):
+        target_path = target_dir / name
+        try:
+            return target_path, target_path.open("xb")
+        except FileExistsError:
+            continue
+
+    # Heavily reused name: fall back to a random suffix
+    while True:
+        target_path = target_dir / f"{base}_{secrets.token_hex(4)}{ext}"
+        try:
+            return target_path, target_path.open("xb")
+        except FileExistsError:
+            continue
+
+
+def _save_upload(source: BinaryIO, target_dir: Path, filename: str) -> tuple[Path, int]:
+    """Copy an uploaded file to disk in chunks, returning its path and size."""
+    target_path, out = _open_unique(target_dir, filename)
+    with out:
+        shutil.copyfileobj(source, out, UPLOAD_CHUNK_SIZE)
+        return target_path, out.tell()
+
+
 @router.post("/files/upload")
 async def upload_file(
-    request: Request,
     file: UploadFile = File(...),
     path: str = "",
     settings: Settings = Depends(get_settings),
+    _auth: bool = Depends(require_auth),
 ) -> dict:
     """Upload a file to the workspace."""
-    auth = get_auth_service()
-    token = request.cookies.get("aipa_session")
-
-    if not token or not auth.verify_session(token):
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    files_root = get_files_path(settings).resolve()
-    target_dir = (files_root / path).resolve()
+    files_root = get_files_root(settings)
 
     # Security: ensure we stay within files directory
-    try:
-        if not str(target_dir).startswith(str(files_root)):
-            raise HTTPException(status_code=403, detail="Access denied")
-    except HTTPException:
-        raise
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid path") from None
+    target_dir = validate_path_within(files_root / path, files_root)
 
     # Create directory if needed
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    # Save file
-    target_path = target_dir / file.filename
-
-    # Prevent overwriting existing files without explicit handling
-    if target_path.exists():
-        # Add counter to filename
-        base = target_path.stem
-        ext = target_path.suffix
-        counter = 1
-        while target_path.exists():
-            target_path = target_dir / f"{base}_{counter}{ext}"
-            counter += 1
+    # Save file (basename only - the client-supplied name must not add path segments)
+    filename = os.path.basename(file.filename or "")
+    if not filename or filename in (".", ".."):
+        raise HTTPException(status_code=400, detail="Invalid filename")
 
+    # Existing files are never overwritten; a numbered name is used instead
     try:
-        content = await file.read()
-        target_path.write_bytes(content)
+        target_path, size = await run_in_threadpool(_save_upload, file.file, target_dir, filename)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save file: {e}") from e
 
@@ -365,25 +498,18 @@ async def upload_file(
         "success": True,
         "filename": target_path.name,
         "path": str(target_path.relative_to(files_root)),
-        "size": len(content),
+        "size": size,
     }
 
 
 @router.post("/files/folder")
 async def create_folder(
-    request: Request,
+    body: CreateFolderRequest,
     settings: Settings = Depends(get_settings),
+    _auth: bool = Depends(require_auth),
 ) -> dict:
     """Create a new folder in the workspace."""
-    auth = get_auth_service()
-    token = request.cookies.get("aipa_session")
-
-    if not token or not auth.verify_session(token):
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    body = await request.json()
-    name = body.get("name", "").strip()
-    path = body.get("path", "")
+    name = body.name.strip()
 
     if not name:
         raise HTTPException(status_code=400, detail="Folder name required")
@@ -392,23 +518,16 @@ async def create_folder(
     if "/" in name or "\\" in name or ".." in name:
         raise HTTPException(status_code=400, detail="Invalid folder name")
 
-    files_root = get_files_path(settings).resolve()
-    target_dir = (files_root / path / name).resolve()
+    files_root = get_files_root(settings)
 
     # Security: ensure we stay within files directory
-    try:
-        if not str(target_dir).startswith(str(files_root)):
-            raise HTTPException(status_code=403, detail="Access denied")
-    except HTTPException:
-        raise
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid path") from None
-
-    if target_dir.exists():
-        raise HTTPException(status_code=400, detail="Folder already exists")
+    target_dir = validate_path_within(files_root / body.path / name, files_root)
 
+    # mkdir reports an existing folder itself; no separate exists() check
     try:
         target_dir.mkdir(parents=True)
+    except FileExistsError:
+        raise HTTPException(status_code=400, detail="Folder already exists") from None
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create folder: {e}") from e
 
@@ -419,45 +538,43 @@ async def create_folder(
     }
 
 
+def _delete_path(target: Path) -> None:
+    """Delete a file, or a directory if it is empty.
+
+    Tries unlink first so deleting a file is a single syscall; rmdir refuses
+    non-empty directories by itself (ENOTEMPTY).
+    """
+    try:
+        os.unlink(target)
+    except IsADirectoryError:
+        os.rmdir(target)
+    except PermissionError:
+        # macOS reports EPERM rather than EISDIR for unlink() on a directory
+        if not target.is_dir():
+            raise
+        os.rmdir(target)
+
+
 @router.delete("/files/{file_path:path}")
 async def delete_file(
-    request: Request,
     file_path: str,
     settings: Settings = Depends(get_settings),
+    _auth: bool = Depends(require_auth),
 ) -> dict:
     """Delete a file or empty folder from the workspace."""
-    auth = get_auth_service()
-    token = request.cookies.get("aipa_session")
-
-    if not token or not auth.verify_session(token):
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    files_root = get_files_path(settings).resolve()
-    target_path = (files_root / file_path).resolve()
+    files_root = get_files_root(settings)
 
     # Security: ensure we stay within files directory
-    try:
-        if not str(target_path).startswith(str(files_root)):
-            raise HTTPException(status_code=403, detail="Access denied")
-    except HTTPException:
-        raise
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid path") from None
-
-    if not target_path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
+    target_path = validate_path_within(files_root / file_path, files_root)
 
     try:
-        if target_path.is_dir():
-            # Only delete empty directories for safety
-            if any(target_path.iterdir()):
-                raise HTTPException(status_code=400, detail="Directory not empty")
-            target_path.rmdir()
-        else:
-            target_path.unlink()
-    except HTTPException:
-        raise
-    except Exception as e:
+        _delete_path(target_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found") from None
+    except OSError as e:
+        # Only delete empty directories for safety
+        if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+            raise HTTPException(status_code=400, detail="Directory not empty") from None
         raise HTTPException(status_code=500, detail=f"Failed to delete: {e}") from e
 
     return {"success": True, "path": file_path}
@@ -1,7 +1,10 @@
 """Session management API endpoints."""
 
-from fastapi import APIRouter, HTTPException, Query, Request, status
+import hashlib
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+
+from server.handlers.auth import require_auth
 from server.models.sessions import (
     CreateSessionRequest,
     CreateSessionResponse,
@@ -13,22 +16,15 @@ from server.models.sessions import (
     SessionListResponse,
     UpdateSessionRequest,
 )
-from server.services.auth import get_auth_service
 from server.services.session_namer import generate_session_name
 from server.services.sessions import get_session_service
 
-router = APIRouter(prefix="/api/sessions", tags=["sessions"])
-
-
-def _require_auth(request: Request) -> None:
-    """Verify user is authenticated via session cookie."""
-    auth = get_auth_service()
-    token = request.cookies.get("aipa_session")
-    if not token or not auth.verify_session(token):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-        )
+# Every session endpoint requires an authenticated session cookie
+router = APIRouter(
+    prefix="/api/sessions",
+    tags=["sessions"],
+    dependencies=[Depends(require_auth)],
+)
 
 
 @router.get("", response_model=SessionListResponse)
@@ -36,24 +32,28 @@ async def list_sessions(
     request: Request,
     limit: int = Query(default=20, ge=1, le=100),
     cursor: str | None = Query(default=None),
-) -> SessionListResponse:
+) -> Response:
     """List all sessions, most recent first."""
-    _require_auth(request)
-
     service = get_session_service()
     sessions, next_cursor = await service.list_sessions(limit=limit, cursor=cursor)
+    body = SessionListResponse(sessions=sessions, next_cursor=next_cursor).model_dump_json()
 
-    return SessionListResponse(sessions=sessions, next_cursor=next_cursor)
+    # Renames and new messages go to other URLs and can't invalidate a
+    # browser-cached listing, so clients always revalidate; the ETag tracks the
+    # listing's content and an unchanged list comes back as a bodyless 304
+    etag = f'"{hashlib.blake2b(body.encode(), digest_size=8).hexdigest()}"'
+    headers = {"Cache-Control": "private, no-cache", "ETag": etag}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post("", response_model=CreateSessionResponse)
 async def create_session(
-    request: Request,
     body: CreateSessionRequest,
 ) -> CreateSessionResponse:
     """Create a new session."""
-    _require_auth(request)
-
     service = get_session_service()
     session = await service.create_session(name=body.name)
 
@@ -62,12 +62,9 @@ async def create_session(
 
 @router.get("/{session_id}", response_model=SessionDetail)
 async def get_session(
-    request: Request,
     session_id: str,
 ) -> SessionDetail:
     """Get a session with all its messages."""
-    _require_auth(request)
-
     service = get_session_service()
     session = await service.get_session(session_id)
 
@@ -82,12 +79,9 @@ async def get_session(
 
 @router.delete("/{session_id}")
 async def delete_session(
-    request: Request,
     session_id: str,
 ) -> dict:
     """Delete a session and all its messages."""
-    _require_auth(request)
-
     service = get_session_service()
     deleted = await service.delete_session(session_id)
 
@@ -102,26 +96,25 @@ async def delete_session(
 
 @router.patch("/{session_id}")
 async def update_session(
-    request: Request,
     session_id: str,
     body: UpdateSessionRequest,
 ) -> dict:
     """Update session metadata (name, status)."""
-    _require_auth(request)
-
     service = get_session_service()
 
-    # Verify session exists
-    session = await service.get_session(session_id)
-    if not session:
+    # The rename reports whether the session exists, so only fall back to a
+    # metadata lookup when there is nothing to write
+    if body.name is not None:
+        found = await service.update_session_name(session_id, body.name)
+    else:
+        found = await service.get_session_summary(session_id) is not None
+
+    if not found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Session not found",
         )
 
-    if body.name is not None:
-        await service.update_session_name(session_id, body.name)
-
     # Note: status updates would go here if needed
 
     return {"success": True, "session_id": session_id}
@@ -129,7 +122,6 @@ async def update_session(
 
 @router.post("/{session_id}/messages", response_model=SendMessageResponse)
 async def add_message(
-    request: Request,
     session_id: str,
     body: SendMessageRequest,
 ) -> SendMessageResponse:
@@ -138,12 +130,10 @@ async def add_message(
     This is used for tracking messages in the session history.
     Actual AI processing happens via the voice/chat endpoints.
     """
-    _require_auth(request)
-
     service = get_session_service()
 
-    # Verify session exists
-    session = await service.get_session(session_id)
+    # Verify session exists (metadata only - the message history isn't needed)
+    session = await service.get_session_summary(session_id)
     if not session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -169,13 +159,10 @@ async def add_message(
 
 @router.post("/{session_id}/fork", response_model=CreateSessionResponse)
 async def fork_session(
-    request: Request,
     session_id: str,
     body: ForkSessionRequest,
 ) -> CreateSessionResponse:
     """Fork a session (create a copy with message history)."""
-    _require_auth(request)
-
     service = get_session_service()
     new_session = await service.fork_session(
         from_session_id=session_id,
@@ -192,10 +179,8 @@ async def fork_session(
 
 
 @router.get("/{session_id}/storage-mode")
-async def get_storage_mode(request: Request, session_id: str) -> dict:
+async def get_storage_mode(session_id: str) -> dict:
     """Get the current storage mode (persistent or in-memory)."""
-    _require_auth(request)
-
     service = get_session_service()
     return {
         "persistent": service.is_persistent,
@@ -3,7 +3,7 @@
 import secrets
 from datetime import timedelta
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel
 
 from server.config import Settings, get_settings
@@ -77,13 +77,9 @@ async def get_voice_token(
     auth = get_auth_service()
     session = get_session_token(request)
     if not session or not auth.verify_session(session):
-        from fastapi import HTTPException, status
-
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
 
     if not settings.livekit_url or not settings.livekit_api_key or not settings.livekit_api_secret:
-        from fastapi import HTTPException, status
-
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="LiveKit not configured",
@@ -93,8 +89,6 @@ async def get_voice_token(
     try:
         from livekit.api import AccessToken, VideoGrants
     except ImportError:
-        from fastapi import HTTPException, status
-
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="LiveKit SDK not installed",
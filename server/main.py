@@ -1,13 +1,26 @@
 """Main FastAPI application for AIPA."""
 
+import atexit
+import gzip
+import hashlib
 import logging
+import logging.handlers
+import os
+import queue
 from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
+from os import PathLike
+from pathlib import Path
+from typing import Any
 
+import pydantic_core
 import structlog
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from server.config import get_settings
 from server.handlers.auth import router as auth_router
@@ -48,6 +61,19 @@ def setup_logging() -> None:
         level=getattr(logging, settings.log_level.upper()),
     )
 
+    # Hand records to a background thread so request handlers only enqueue them;
+    # the listener owns the real (stderr) handlers and does the writes
+    root = logging.getLogger()
+    if not any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers):
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, *root.handlers, respect_handler_level=True
+        )
+        root.handlers = [logging.handlers.QueueHandler(log_queue)]
+        listener.start()
+        # Flush anything still queued when the process exits
+        atexit.register(listener.stop)
+
     # Reduce noise from verbose libraries
     logging.getLogger("livekit").setLevel(logging.WARNING)
     logging.getLogger("livekit.agents").setLevel(logging.WARNING)
@@ -63,13 +89,13 @@ async def lifespan(app: FastAPI):
     logger = logging.getLogger(__name__)
     settings = get_settings()
 
-    logger.info(f"Starting {settings.agent_name} ({settings.environment})")
+    logger.info("Starting %s (%s)", settings.agent_name, settings.environment)
 
     if not settings.auth_password_hash:
         logger.warning("AUTH_PASSWORD_HASH not set - authentication disabled!")
 
     if settings.has_session_storage:
-        logger.info(f"Session storage: DynamoDB ({settings.dynamodb_sessions_table})")
+        logger.info("Session storage: DynamoDB (%s)", settings.dynamodb_sessions_table)
     else:
         logger.warning("DYNAMODB_SESSIONS_TABLE not set - sessions will be in-memory only")
 
@@ -89,17 +115,79 @@ async def lifespan(app: FastAPI):
             start_voice_agent_background()
             logger.info("Voice agent started in background")
         except Exception as e:
-            logger.error(f"Failed to start voice agent: {e}")
+            logger.error("Failed to start voice agent: %s", e)
 
     logger.info("Application started")
     yield
     logger.info("Shutting down...")
 
 
+class PydanticJSONResponse(JSONResponse):
+    """JSONResponse encoded by pydantic-core instead of json.dumps.
+
+    Same compact UTF-8 output as Starlette's renderer, several times faster for
+    list payloads (file listings, sessions).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
+
+
 # Create FastAPI app
 setup_logging()
 settings = get_settings()
 templates = Jinja2Templates(directory="server/templates")
+templates.env.auto_reload = not settings.is_production
+
+STATIC_DIR = Path("server/static")
+
+
+def _asset_version(name: str) -> str:
+    """Short content hash of a static asset, used to bust browser caches."""
+    return hashlib.blake2b((STATIC_DIR / name).read_bytes(), digest_size=8).hexdigest()
+
+
+if settings.is_production:
+    # Assets only change on deploy
+    _asset_version = lru_cache(maxsize=None)(_asset_version)
+
+
+def static_url(name: str) -> str:
+    """URL for a static asset, versioned by content so it can be cached forever."""
+    return f"/static/{name}?v={_asset_version(name)}"
+
+
+templates.env.globals["static_url"] = static_url
+
+
+class VersionedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers keep versioned (?v=...) assets indefinitely."""
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if settings.is_production and b"v=" in scope.get("query_string", b""):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+def _render_index() -> bytes:
+    """Render the voice UI page (it only interpolates agent_name)."""
+    return templates.get_template("chat.html").render(agent_name=settings.agent_name).encode()
+
+
+# Settings don't change at runtime, so production renders the page once here;
+# development re-renders per request so template edits show up
+_INDEX_HTML = _render_index() if settings.is_production else None
+_INDEX_ETAG = f'"{hashlib.sha256(_INDEX_HTML).hexdigest()[:32]}"' if _INDEX_HTML else None
+# The page is ~65KB of mostly inline CSS/JS; compress it once rather than per request
+_INDEX_GZIP = gzip.compress(_INDEX_HTML, 9) if _INDEX_HTML else None
+_INDEX_GZIP_ETAG = f'{_INDEX_ETAG[:-1]}-gzip"' if _INDEX_ETAG else None
 
 app = FastAPI(
     title=f"AIPA - {settings.agent_name}",
@@ -108,43 +196,134 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs" if not settings.is_production else None,
     redoc_url=None,
+    default_response_class=PydanticJSONResponse,
 )
 
 # Include routers
 app.include_router(auth_router, tags=["auth"])
-app.include_router(chat_router, tags=["chat"])
+# Chat API is only exposed in production when explicitly enabled
+if not settings.is_production or settings.enable_chat_api:
+    app.include_router(chat_router, tags=["chat"])
 app.include_router(files_router, tags=["files"])
 app.include_router(sessions_router, tags=["sessions"])
 app.include_router(voice_router, tags=["voice"])
+app.mount("/static", VersionedStaticFiles(directory=STATIC_DIR), name="static")
+
+
+# Everything but the timestamp is fixed for the life of the process, so the
+# serialized payload is split around it once and the timestamp spliced in
+_HEALTH = HealthResponse(
+    status="healthy",
+    agent_name=settings.agent_name,
+    environment=settings.environment,
+)
+_HEALTH_PREFIX, _HEALTH_SUFFIX = _HEALTH.model_dump_json().split(_HEALTH.timestamp.isoformat())
+
+
+def _health_payload() -> bytes:
+    """Serialized HealthResponse for the current time."""
+    # isoformat() matches pydantic's datetime serialization (no escaping needed)
+    return (_HEALTH_PREFIX + datetime.utcnow().isoformat() + _HEALTH_SUFFIX).encode()
+
+
+class HealthCheckMiddleware:
+    """Answer GET/HEAD /health before FastAPI's routing and dependency handling.
+
+    Load balancer probes hit this constantly; the route below stays registered
+    so /health is still documented in the OpenAPI schema.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] != "/health"
+            or scope["method"] not in ("GET", "HEAD")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        body = _health_payload()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send(
+            {"type": "http.response.body", "body": body if scope["method"] == "GET" else b""}
+        )
+
+
+app.add_middleware(HealthCheckMiddleware)
 
 
 @app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """Health check endpoint (no auth required)."""
-    return HealthResponse(
-        status="healthy",
-        agent_name=settings.agent_name,
-        environment=settings.environment,
-        timestamp=datetime.utcnow(),
-    )
+    return Response(content=_health_payload(), media_type="application/json")
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (q=0 means refused)."""
+    wildcard = False
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip().lower()
+        if name not in ("gzip", "*"):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name == "gzip":
+            # An explicit gzip entry overrides the wildcard either way
+            return q > 0
+        wildcard = q > 0
+    return wildcard
+
+
+# Stateless, so one instance is reused for every unauthenticated hit on /
+# (Response.__call__ only reads its stored body and headers)
+_LOGIN_REDIRECT = RedirectResponse(url="/login", status_code=302)
 
 
 @app.get("/")
-async def index(request: Request) -> HTMLResponse:
+async def index(request: Request) -> Response:
     """Main voice UI page."""
     auth = get_auth_service()
     token = request.cookies.get("aipa_session")
 
     if not token or not auth.verify_session(token):
-        return RedirectResponse(url="/login", status_code=302)
-
-    return templates.TemplateResponse(
-        "chat.html",
-        {
-            "request": request,
-            "agent_name": settings.agent_name,
-        },
-    )
+        return _LOGIN_REDIRECT
+
+    if _INDEX_HTML is None:
+        return HTMLResponse(content=_render_index())
+
+    # no-cache: browsers revalidate every load (so the auth check above still
+    # runs) but get a bodyless 304 while the page is unchanged
+    headers = {"Cache-Control": "private, no-cache", "Vary": "Accept-Encoding"}
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        body, etag = _INDEX_GZIP, _INDEX_GZIP_ETAG
+        headers["Content-Encoding"] = "gzip"
+    else:
+        body, etag = _INDEX_HTML, _INDEX_ETAG
+    headers["ETag"] = etag
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=body, headers=headers)
 
 
 # Legacy inline HTML removed - now using templates/chat.html
@@ -154,11 +333,22 @@ async def index(request: Request) -> HTMLResponse:
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
     logger = logging.getLogger(__name__)
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     return JSONResponse(status_code=500, content={"detail": "An internal error occurred."})
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("server.main:app", host="0.0.0.0", port=8000, reload=not settings.is_production)
+    # uvicorn[standard] ships uvloop and httptools in the (Linux) image; name them
+    # in production so a missing extra fails loudly instead of silently falling
+    # back to asyncio/h11. Per-request access lines are only logged in development.
+    uvicorn.run(
+        "server.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=not settings.is_production,
+        loop="uvloop" if settings.is_production else "auto",
+        http="httptools" if settings.is_production else "auto",
+        access_log=not settings.is_production,
+    )
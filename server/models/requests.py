@@ -2,12 +2,14 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class HealthResponse(BaseModel):
     """Health check response."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(default="healthy")
     agent_name: str
     environment: str
@@ -21,9 +23,19 @@ class LoginRequest(BaseModel):
     password: str = Field(..., description="Login password")
 
 
+class CreateFolderRequest(BaseModel):
+    """Create folder request."""
+
+    name: str = ""
+    path: str = ""  # Parent directory, relative to the files root
+
+
 class FileInfo(BaseModel):
     """Information about a file in the workspace."""
 
+    # Shared between requests by the directory listing cache
+    model_config = ConfigDict(frozen=True)
+
     name: str
     path: str
     size: int
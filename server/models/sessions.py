@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MessageSource(str, Enum):
@@ -32,6 +32,8 @@ class SessionStatus(str, Enum):
 class SessionMessage(BaseModel):
     """A single message in a conversation session."""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime
     role: MessageRole
     content: str
@@ -63,6 +65,9 @@ class Session(BaseModel):
 class SessionSummary(BaseModel):
     """Summary for session list (without full message history)."""
 
+    # Shared between requests by SessionService's list cache
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     created: datetime
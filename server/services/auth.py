@@ -1,11 +1,18 @@
 """Authentication service with rate limiting."""
 
+import hmac
 import secrets
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 import bcrypt
 
+SESSION_TTL = 86400  # Sessions valid for 24 hours
+MAX_TRACKED_IPS = 4096  # Least recently seen IPs are forgotten beyond this
+SESSION_SWEEP_INTERVAL = 256  # Sweep expired sessions every this many logins
+
 
 @dataclass
 class LoginAttempt:
@@ -14,6 +21,7 @@ class LoginAttempt:
     attempts: int = 0
     locked_until: float = 0
     last_attempt: float = 0
+    pending: int = 0  # Checks reserved but still running bcrypt
 
 
 @dataclass
@@ -22,8 +30,15 @@ class AuthService:
 
     password_hash: str
     session_secret: str
-    _attempts: dict[str, LoginAttempt] = field(default_factory=dict)
-    _sessions: dict[str, float] = field(default_factory=dict)
+    _attempts: OrderedDict[str, LoginAttempt] = field(default_factory=OrderedDict)
+    _sessions: dict[str, float] = field(default_factory=dict)  # token -> expiry time
+    _logins: int = 0  # Sessions created so far, drives the periodic sweep
+    # Keyed digest of the last password bcrypt accepted, so repeat logins with
+    # the (single, shared) password skip the deliberately slow hash
+    _verified_digest: bytes | None = None
+    # check_password runs in the threadpool and bcrypt releases the GIL, so
+    # attempt bookkeeping is serialised to keep parallel guesses inside the limit
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     # Rate limiting config
     max_attempts: int = 5
@@ -32,9 +47,15 @@ class AuthService:
 
     def _get_attempt(self, ip: str) -> LoginAttempt:
         """Get or create login attempt tracker for IP."""
-        if ip not in self._attempts:
-            self._attempts[ip] = LoginAttempt()
-        return self._attempts[ip]
+        attempt = self._attempts.get(ip)
+        if attempt is not None:
+            self._attempts.move_to_end(ip)
+            return attempt
+
+        attempt = self._attempts[ip] = LoginAttempt()
+        if len(self._attempts) > MAX_TRACKED_IPS:
+            self._attempts.popitem(last=False)
+        return attempt
 
     def is_locked(self, ip: str) -> tuple[bool, int]:
         """Check if IP is locked out. Returns (locked, seconds_remaining)."""
@@ -52,23 +73,43 @@ class AuthService:
 
         Returns (success, session_token or error_message).
         """
-        locked, remaining = self.is_locked(ip)
-        if locked:
-            return False, f"Too many attempts. Try again in {remaining} seconds."
-
-        attempt = self._get_attempt(ip)
-        now = time.time()
-
         # Check if password hash is configured
         if not self.password_hash:
             return False, "Authentication not configured"
 
+        # Reserve the attempt before the slow check so concurrent requests from
+        # one IP can't all get past the lockout while bcrypt runs
+        with self._lock:
+            locked, remaining = self.is_locked(ip)
+            if locked:
+                return False, f"Too many attempts. Try again in {remaining} seconds."
+
+            attempt = self._get_attempt(ip)
+            if attempt.pending and attempt.attempts + attempt.pending >= self.max_attempts:
+                return False, "Too many attempts. Try again later."
+            attempt.pending += 1
+
         # Verify password
+        success = False
         try:
             password_bytes = password.encode("utf-8")
             hash_bytes = self.password_hash.encode("utf-8")
+            digest = self._password_digest(password_bytes)
+
+            success = (
+                self._verified_digest is not None
+                and hmac.compare_digest(digest, self._verified_digest)
+            ) or bcrypt.checkpw(password_bytes, hash_bytes)
+        except Exception:
+            pass
+
+        with self._lock:
+            attempt.pending -= 1
+            now = time.time()
+
+            if success:
+                self._verified_digest = digest
 
-            if bcrypt.checkpw(password_bytes, hash_bytes):
                 # Success - reset attempts
                 attempt.attempts = 0
                 attempt.locked_until = 0
@@ -76,40 +117,54 @@ class AuthService:
                 # Create session token
                 token = self._create_session()
                 return True, token
-        except Exception:
-            pass
 
-        # Failed attempt
-        attempt.attempts += 1
-        attempt.last_attempt = now
+            # Failed attempt
+            attempt.attempts += 1
+            attempt.last_attempt = now
 
-        if attempt.attempts >= self.max_attempts:
-            # Exponential backoff: 1min, 2min, 4min, 8min, ... up to 1 hour
-            lockout_time = min(
-                self.lockout_base * (2 ** (attempt.attempts - self.max_attempts)),
-                self.lockout_max,
-            )
-            attempt.locked_until = now + lockout_time
-            return False, f"Too many attempts. Locked for {int(lockout_time)} seconds."
+            if attempt.attempts >= self.max_attempts:
+                # Exponential backoff: 1min, 2min, 4min, 8min, ... up to 1 hour
+                lockout_time = min(
+                    self.lockout_base * (2 ** (attempt.attempts - self.max_attempts)),
+                    self.lockout_max,
+                )
+                attempt.locked_until = now + lockout_time
+                return False, f"Too many attempts. Locked for {int(lockout_time)} seconds."
 
-        remaining = self.max_attempts - attempt.attempts
-        return False, f"Invalid password. {remaining} attempts remaining."
+            remaining = self.max_attempts - attempt.attempts
+            return False, f"Invalid password. {remaining} attempts remaining."
+
+    def _password_digest(self, password_bytes: bytes) -> bytes:
+        """HMAC of a password candidate, keyed by the session secret and hash."""
+        key = (self.session_secret + self.password_hash).encode("utf-8")
+        return hmac.new(key, password_bytes, "sha256").digest()
 
     def _create_session(self) -> str:
         """Create a new session token."""
+        now = time.time()
+        self._logins += 1
+        if self._logins % SESSION_SWEEP_INTERVAL == 0:
+            self._sweep_sessions(now)
+
         token = secrets.token_urlsafe(32)
-        self._sessions[token] = time.time()
+        self._sessions[token] = now + SESSION_TTL
         return token
 
+    def _sweep_sessions(self, now: float) -> None:
+        """Drop expired sessions that were never presented again."""
+        # Snapshot first: logins run in the threadpool while the event loop verifies/expires
+        expired = [t for t, expires in list(self._sessions.items()) if expires < now]
+        for token in expired:
+            self._sessions.pop(token, None)
+
     def verify_session(self, token: str) -> bool:
         """Verify a session token is valid."""
-        if not token or token not in self._sessions:
+        expires = self._sessions.get(token) if token else None
+        if expires is None:
             return False
 
-        # Sessions valid for 24 hours
-        created = self._sessions[token]
-        if time.time() - created > 86400:
-            del self._sessions[token]
+        if expires < time.time():
+            self._sessions.pop(token, None)
             return False
 
         return True
@@ -119,9 +174,9 @@ class AuthService:
         self._sessions.pop(token, None)
 
 
-def hash_password(password: str) -> str:
-    """Hash a password for storage."""
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+def hash_password(password: str, rounds: int = 12) -> str:
+    """Hash a password for storage (lower rounds are only meant for tests)."""
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=rounds)).decode("utf-8")
 
 
 # Singleton instance
@@ -5,7 +5,6 @@ instead of requiring a separate ANTHROPIC_API_KEY.
 """
 
 import asyncio
-import json
 import logging
 import os
 import re
@@ -14,6 +13,7 @@ from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
 from typing import Any
 
+import pydantic_core
 from livekit.agents.llm import (
     LLM,
     ChatChunk,
@@ -28,6 +28,28 @@ logger = logging.getLogger(__name__)
 # Activity callback type: (activity_type, message, details)
 ActivityCallback = Callable[[str, str, dict | None], None]
 
+# Bytes requested per read of the CLI's stream-json output
+READ_CHUNK_SIZE = 64 * 1024
+
+# Map Claude Code tools (by name prefix) to activity types
+TOOL_ACTIVITIES: dict[str, tuple[str, str]] = {
+    "WebSearch": ("search", "Searching the web"),
+    "WebFetch": ("search", "Fetching web content"),
+    "Read": ("read", "Reading file"),
+    "Write": ("write", "Creating file"),
+    "Edit": ("edit", "Editing file"),
+    "Bash": ("code", "Running command"),
+    "Glob": ("search", "Finding files"),
+    "Grep": ("search", "Searching code"),
+    "Task": ("agent", "Starting sub-agent"),
+    "mcp__notion": ("notion", "Accessing Notion"),
+    "mcp__github": ("github", "Accessing GitHub"),
+}
+_TOOL_PREFIXES = tuple(TOOL_ACTIVITIES)
+
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
 
 def chunk_text_for_tts(text: str, max_chars: int = 500) -> list[str]:
     """Split text into chunks suitable for TTS processing.
@@ -39,98 +61,121 @@ def chunk_text_for_tts(text: str, max_chars: int = 500) -> list[str]:
         return [text] if text.strip() else []
 
     chunks = []
-    current_chunk = ""
+    # Pieces of the chunk being built and the length they'll have once joined,
+    # so the chunk is only concatenated when it's emitted
+    parts: list[str] = []
+    length = 0
 
-    # Split by sentence-ending punctuation
-    sentences = re.split(r"(?<=[.!?])\s+", text)
-
-    for sentence in sentences:
+    for sentence in _SENTENCE_END_RE.split(text):
         sentence = sentence.strip()
         if not sentence:
             continue
 
         # If adding this sentence exceeds limit, start new chunk
-        if len(current_chunk) + len(sentence) + 1 > max_chars:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-                current_chunk = ""
+        if length + len(sentence) + 1 > max_chars:
+            if parts:
+                chunks.append(" ".join(parts))
+                parts, length = [], 0
 
             # If single sentence is too long, split by word
             if len(sentence) > max_chars:
-                words = sentence.split()
-                for word in words:
-                    if len(current_chunk) + len(word) + 1 > max_chars:
-                        if current_chunk:
-                            chunks.append(current_chunk.strip())
-                        current_chunk = word
+                for word in sentence.split():
+                    if length + len(word) + 1 > max_chars:
+                        if parts:
+                            chunks.append(" ".join(parts))
+                        parts, length = [word], len(word)
                     else:
-                        current_chunk = f"{current_chunk} {word}".strip()
+                        length += len(word) + 1 if parts else len(word)
+                        parts.append(word)
             else:
-                current_chunk = sentence
+                parts, length = [sentence], len(sentence)
         else:
-            current_chunk = f"{current_chunk} {sentence}".strip()
+            length += len(sentence) + 1 if parts else len(sentence)
+            parts.append(sentence)
 
-    if current_chunk:
-        chunks.append(current_chunk.strip())
+    if parts:
+        chunks.append(" ".join(parts))
 
     return chunks
 
 
+# Markdown patterns stripped before text is spoken, applied in this order
+# Sources section (WebSearch results) - everything from "Sources:" to end,
+# e.g. "Sources:", "Source:", "\n\nSources:"
+_SOURCES_RE = re.compile(r"\n*Sources?:\s*\n.*", re.DOTALL | re.IGNORECASE)
+# Source citations in brackets: [Source: ...], [Source 1], [1]
+_SOURCE_CITE_RE = re.compile(r"\[Source[^\]]*\]", re.IGNORECASE)
+_NUM_CITE_RE = re.compile(r"\[\d+\]")
+_URL_RE = re.compile(r"https?://\S+")
+_CODE_BLOCK_RE = re.compile(r"```[\s\S]*?```")
+_INLINE_CODE_RE = re.compile(r"`([^`]+)`")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\([^)]+\)")
+_BOLD_STAR_RE = re.compile(r"\*\*([^*]+)\*\*")
+_ITALIC_STAR_RE = re.compile(r"\*([^*]+)\*")
+_BOLD_UNDER_RE = re.compile(r"__([^_]+)__")
+_ITALIC_UNDER_RE = re.compile(r"_([^_]+)_")
+_HEADER_RE = re.compile(r"^#{1,6}\s+", re.MULTILINE)
+_HR_RE = re.compile(r"^[-*_]{3,}\s*$", re.MULTILINE)
+_BULLET_RE = re.compile(r"^[\s]*[-*+]\s+", re.MULTILINE)
+_NUMBERED_RE = re.compile(r"^[\s]*\d+\.\s+", re.MULTILINE)
+_QUOTE_RE = re.compile(r"^>\s+", re.MULTILINE)
+_NEWLINES_RE = re.compile(r"\n{3,}")
+_SPACES_RE = re.compile(r"  +")
+
+
 def strip_markdown_for_speech(text: str) -> str:
     """Strip markdown formatting from text for natural speech.
 
     Removes code blocks, links, emphasis, sources, URLs, etc.
     while preserving readable content for TTS.
     """
-    # Remove Sources section (WebSearch results) - everything from "Sources:" to end or next section
-    # Matches: "Sources:", "Source:", "\n\nSources:", etc.
-    text = re.sub(r"\n*Sources?:\s*\n.*", "", text, flags=re.DOTALL | re.IGNORECASE)
-
-    # Remove source citations in brackets: [Source: ...], [1], [Source 1], etc.
-    text = re.sub(r"\[Source[^\]]*\]", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\[\d+\]", "", text)
+    # Remove Sources section and citations
+    text = _SOURCES_RE.sub("", text)
+    text = _SOURCE_CITE_RE.sub("", text)
+    text = _NUM_CITE_RE.sub("", text)
 
     # Remove standalone URLs (http/https)
-    text = re.sub(r"https?://\S+", "", text)
+    text = _URL_RE.sub("", text)
 
     # Remove code blocks (```...```)
-    text = re.sub(r"```[\s\S]*?```", "[code block]", text)
+    text = _CODE_BLOCK_RE.sub("[code block]", text)
 
     # Remove inline code (`...`)
-    text = re.sub(r"`([^`]+)`", r"\1", text)
+    text = _INLINE_CODE_RE.sub(r"\1", text)
 
     # Remove links but keep text: [text](url) -> text
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
+    text = _LINK_RE.sub(r"\1", text)
 
     # Remove images: ![alt](url)
-    text = re.sub(r"!\[([^\]]*)\]\([^)]+\)", r"\1", text)
+    text = _IMAGE_RE.sub(r"\1", text)
 
     # Remove bold/italic markers
-    text = re.sub(r"\*\*([^*]+)\*\*", r"\1", text)  # **bold**
-    text = re.sub(r"\*([^*]+)\*", r"\1", text)  # *italic*
-    text = re.sub(r"__([^_]+)__", r"\1", text)  # __bold__
-    text = re.sub(r"_([^_]+)_", r"\1", text)  # _italic_
+    text = _BOLD_STAR_RE.sub(r"\1", text)  # **bold**
+    text = _ITALIC_STAR_RE.sub(r"\1", text)  # *italic*
+    text = _BOLD_UNDER_RE.sub(r"\1", text)  # __bold__
+    text = _ITALIC_UNDER_RE.sub(r"\1", text)  # _italic_
 
     # Remove headers (# Header)
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
+    text = _HEADER_RE.sub("", text)
 
     # Remove horizontal rules
-    text = re.sub(r"^[-*_]{3,}\s*$", "", text, flags=re.MULTILINE)
+    text = _HR_RE.sub("", text)
 
     # Remove bullet points but keep content
-    text = re.sub(r"^[\s]*[-*+]\s+", "", text, flags=re.MULTILINE)
+    text = _BULLET_RE.sub("", text)
 
     # Remove numbered list markers
-    text = re.sub(r"^[\s]*\d+\.\s+", "", text, flags=re.MULTILINE)
+    text = _NUMBERED_RE.sub("", text)
 
     # Remove blockquotes
-    text = re.sub(r"^>\s+", "", text, flags=re.MULTILINE)
+    text = _QUOTE_RE.sub("", text)
 
     # Clean up multiple newlines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _NEWLINES_RE.sub("\n\n", text)
 
     # Clean up multiple spaces
-    text = re.sub(r"  +", " ", text)
+    text = _SPACES_RE.sub(" ", text)
 
     return text.strip()
 
@@ -196,24 +241,10 @@ class ClaudeCodeLLMStream(LLMStream):
 
     def _parse_tool_name(self, tool_name: str) -> tuple[str, str]:
         """Parse tool name into activity type and friendly name."""
-        # Map Claude Code tools to activity types
-        tool_mappings = {
-            "WebSearch": ("search", "Searching the web"),
-            "WebFetch": ("search", "Fetching web content"),
-            "Read": ("read", "Reading file"),
-            "Write": ("write", "Creating file"),
-            "Edit": ("edit", "Editing file"),
-            "Bash": ("code", "Running command"),
-            "Glob": ("search", "Finding files"),
-            "Grep": ("search", "Searching code"),
-            "Task": ("agent", "Starting sub-agent"),
-            "mcp__notion": ("notion", "Accessing Notion"),
-            "mcp__github": ("github", "Accessing GitHub"),
-        }
-
-        for prefix, (activity_type, friendly) in tool_mappings.items():
-            if tool_name.startswith(prefix):
-                return activity_type, friendly
+        if tool_name.startswith(_TOOL_PREFIXES):
+            for prefix, (activity_type, friendly) in TOOL_ACTIVITIES.items():
+                if tool_name.startswith(prefix):
+                    return activity_type, friendly
 
         # Default for unknown tools
         return "tool", f"Using {tool_name}"
@@ -222,10 +253,13 @@ class ClaudeCodeLLMStream(LLMStream):
         """Execute the Claude Code CLI and stream results."""
         # Build the prompt from chat context
         messages = []
-        logger.debug(f"Chat context has {len(self._chat_ctx.items)} items")
+        logger.debug("Chat context has %d items", len(self._chat_ctx.items))
+        # dir() is built even when the record is dropped, so only pay for it when debugging
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         for msg in self._chat_ctx.items:
-            logger.debug(f"Message type: {type(msg)}, attrs: {dir(msg)[:10]}...")
+            if debug:
+                logger.debug("Message type: %s, attrs: %s...", type(msg), dir(msg)[:10])
             role = None
             content = ""
 
@@ -239,13 +273,15 @@ class ClaudeCodeLLMStream(LLMStream):
                     content = msg.content
                 elif isinstance(msg.content, list):
                     # Handle content blocks
+                    parts = []
                     for block in msg.content:
                         if hasattr(block, "text"):
-                            content += block.text
+                            parts.append(block.text)
                         elif isinstance(block, str):
-                            content += block
+                            parts.append(block)
                         elif hasattr(block, "content"):
-                            content += str(block.content)
+                            parts.append(str(block.content))
+                    content = "".join(parts)
             elif hasattr(msg, "text"):
                 content = msg.text
 
@@ -334,86 +370,87 @@ class ClaudeCodeLLMStream(LLMStream):
                 if not line.strip():
                     continue
 
-                # Parse JSON event
+                # Parse JSON event (pydantic-core's parser is ~2x faster per event)
                 try:
-                    event = json.loads(line)
-                    event_type = event.get("type", "")
-
-                    # Log all events for debugging
-                    logger.info(f"[CLAUDE] Event: {event_type}")
-
-                    # Handle different event types
-                    if event_type == "assistant":
-                        # Assistant message - extract text content
-                        message = event.get("message", {})
-                        content = message.get("content", [])
-                        for block in content:
-                            if block.get("type") == "text":
-                                text = block.get("text", "")
-                                if text:
-                                    full_response.append(text)
-                                    logger.info(f"[CLAUDE] Text: {text[:100]}...")
-
-                    elif event_type == "content_block_delta":
-                        # Streaming text delta
-                        delta = event.get("delta", {})
-                        if delta.get("type") == "text_delta":
-                            full_response.append(delta.get("text", ""))
-
-                    elif event_type == "tool_use":
-                        # Tool being used - emit activity
-                        tool_name = event.get("name", "unknown")
-                        tool_input = event.get("input", {})
-                        activity_type, friendly_name = self._parse_tool_name(tool_name)
-                        logger.info(f"[CLAUDE] Tool: {tool_name}")
-                        self._emit_activity(
-                            activity_type, friendly_name, {"tool": tool_name, "input": tool_input}
-                        )
-
-                    elif event_type == "content_block_start":
-                        # Content block starting - may contain tool_use
-                        content_block = event.get("content_block", {})
-                        if content_block.get("type") == "tool_use":
-                            tool_name = content_block.get("name", "unknown")
-                            tool_id = content_block.get("id", "")
-                            activity_type, friendly_name = self._parse_tool_name(tool_name)
-                            logger.info(f"[CLAUDE] Tool (block_start): {tool_name} [{tool_id}]")
-                            self._emit_activity(
-                                activity_type,
-                                friendly_name,
-                                {"tool": tool_name, "tool_id": tool_id},
-                            )
-
-                    elif event_type in ("tool_input", "tool_call"):
-                        # Alternative tool event formats from some CLI versions
-                        tool_name = event.get("name", event.get("tool", "unknown"))
-                        tool_input = event.get("input", event.get("arguments", {}))
-                        activity_type, friendly_name = self._parse_tool_name(tool_name)
-                        logger.info(f"[CLAUDE] Tool ({event_type}): {tool_name}")
-                        self._emit_activity(
-                            activity_type, friendly_name, {"tool": tool_name, "input": tool_input}
-                        )
-
-                    elif event_type == "result":
-                        # Final result - may contain text
-                        result_text = event.get("result", "")
-                        if result_text and isinstance(result_text, str):
-                            full_response.append(result_text)
-                            logger.info(f"[CLAUDE] Result: {result_text[:100]}...")
-
-                    elif event_type == "system":
-                        # System message (thinking, status, etc.)
-                        msg = event.get("message", "")
-                        if msg:
-                            logger.info(f"[CLAUDE] System: {msg}")
-                            self._emit_activity("thinking", msg)
-
-                except json.JSONDecodeError:
+                    event = pydantic_core.from_json(line)
+                except ValueError:
                     # Not JSON - might be plain text fallback or verbose output
                     line_stripped = line.strip()
                     if line_stripped and not line_stripped.startswith("{"):
                         logger.info(f"[CLAUDE] Output: {line_stripped[:150]}")
                         full_response.append(line)
+                    continue
+
+                event_type = event.get("type", "")
+
+                # Log all events for debugging
+                logger.info(f"[CLAUDE] Event: {event_type}")
+
+                # Handle different event types
+                if event_type == "assistant":
+                    # Assistant message - extract text content
+                    message = event.get("message", {})
+                    content = message.get("content", [])
+                    for block in content:
+                        if block.get("type") == "text":
+                            text = block.get("text", "")
+                            if text:
+                                full_response.append(text)
+                                logger.info(f"[CLAUDE] Text: {text[:100]}...")
+
+                elif event_type == "content_block_delta":
+                    # Streaming text delta
+                    delta = event.get("delta", {})
+                    if delta.get("type") == "text_delta":
+                        full_response.append(delta.get("text", ""))
+
+                elif event_type == "tool_use":
+                    # Tool being used - emit activity
+                    tool_name = event.get("name", "unknown")
+                    tool_input = event.get("input", {})
+                    activity_type, friendly_name = self._parse_tool_name(tool_name)
+                    logger.info(f"[CLAUDE] Tool: {tool_name}")
+                    self._emit_activity(
+                        activity_type, friendly_name, {"tool": tool_name, "input": tool_input}
+                    )
+
+                elif event_type == "content_block_start":
+                    # Content block starting - may contain tool_use
+                    content_block = event.get("content_block", {})
+                    if content_block.get("type") == "tool_use":
+                        tool_name = content_block.get("name", "unknown")
+                        tool_id = content_block.get("id", "")
+                        activity_type, friendly_name = self._parse_tool_name(tool_name)
+                        logger.info(f"[CLAUDE] Tool (block_start): {tool_name} [{tool_id}]")
+                        self._emit_activity(
+                            activity_type,
+                            friendly_name,
+                            {"tool": tool_name, "tool_id": tool_id},
+                        )
+
+                elif event_type in ("tool_input", "tool_call"):
+                    # Alternative tool event formats from some CLI versions
+                    tool_name = event.get("name", event.get("tool", "unknown"))
+                    tool_input = event.get("input", event.get("arguments", {}))
+                    activity_type, friendly_name = self._parse_tool_name(tool_name)
+                    logger.info(f"[CLAUDE] Tool ({event_type}): {tool_name}")
+                    self._emit_activity(
+                        activity_type, friendly_name, {"tool": tool_name, "input": tool_input}
+                    )
+
+                elif event_type == "result":
+                    # Final result - may contain text
+                    result_text = event.get("result", "")
+                    if result_text and isinstance(result_text, str):
+                        full_response.append(result_text)
+                        logger.info(f"[CLAUDE] Result: {result_text[:100]}...")
+
+                elif event_type == "system":
+                    # System message (thinking, status, etc.)
+                    msg = event.get("message", "")
+                    if msg:
+                        logger.info(f"[CLAUDE] System: {msg}")
+                        self._emit_activity("thinking", msg)
 
             # Process complete response
             if full_response and not self._cancelled:
@@ -468,14 +505,32 @@ class ClaudeCodeLLMStream(LLMStream):
             raise
 
     async def _read_lines(self, stream: asyncio.StreamReader | None) -> AsyncIterator[str]:
-        """Read lines from stream asynchronously."""
+        """Read lines from stream asynchronously.
+
+        Reads in large chunks rather than with readline(), which raises once a
+        line (e.g. an event carrying a big tool result) exceeds the
+        StreamReader's 64KB limit, and yields every complete line per read.
+        """
         if not stream:
             return
+        pending: list[bytes] = []
         while True:
-            line = await stream.readline()
-            if not line:
+            data = await stream.read(READ_CHUNK_SIZE)
+            if not data:
                 break
-            yield line.decode("utf-8")
+            end = data.rfind(b"\n") + 1
+            if not end:
+                # Middle of a long line - only join it once its end arrives
+                pending.append(data)
+                continue
+            pending.append(data[:end])
+            # A chunk ending on b"\n" never splits a UTF-8 sequence
+            block = b"".join(pending).decode("utf-8")
+            pending = [data[end:]] if end < len(data) else []
+            for line in block.split("\n")[:-1]:
+                yield line + "\n"
+        if pending:
+            yield b"".join(pending).decode("utf-8")
 
 
 class ClaudeCodeLLM(LLM):
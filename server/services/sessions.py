@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import sqlite3
+import time
 import uuid
 from datetime import datetime
 
@@ -25,6 +26,11 @@ from server.models.sessions import (
 
 logger = logging.getLogger(__name__)
 
+# list_sessions results are reused for this long (seconds); the files page and
+# sidebar re-request the same page on every load
+LIST_CACHE_TTL = 5.0
+LIST_CACHE_MAX_ENTRIES = 64
+
 
 class SQLiteSessionStore:
     """SQLite-based session storage for local development."""
@@ -183,10 +189,31 @@ class SQLiteSessionStore:
                 )
             conn.commit()
 
-    def update_session_name(self, session_id: str, name: str) -> None:
+    def get_session_summary(self, session_id: str) -> SessionSummary | None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute(
+                "SELECT id, name, created, updated, message_count, preview "
+                "FROM sessions WHERE id = ?",
+                (session_id,),
+            ).fetchone()
+            if not row:
+                return None
+
+            return SessionSummary(
+                id=row["id"],
+                name=row["name"],
+                created=datetime.fromisoformat(row["created"]),
+                updated=datetime.fromisoformat(row["updated"]),
+                message_count=row["message_count"],
+                preview=row["preview"] or "",
+            )
+
+    def update_session_name(self, session_id: str, name: str) -> bool:
         with sqlite3.connect(self.db_path) as conn:
-            conn.execute("UPDATE sessions SET name = ? WHERE id = ?", (name, session_id))
+            result = conn.execute("UPDATE sessions SET name = ? WHERE id = ?", (name, session_id))
             conn.commit()
+            return result.rowcount > 0
 
     def delete_session(self, session_id: str) -> bool:
         with sqlite3.connect(self.db_path) as conn:
@@ -248,6 +275,11 @@ class SessionService:
         self._table = None
         self._sqlite: SQLiteSessionStore | None = None
         self._local_sessions: dict[str, SessionDetail] = {}
+        # (limit, cursor) -> (expires_at, (sessions, next_cursor))
+        self._list_cache: dict[
+            tuple[int, str | None],
+            tuple[float, tuple[list[SessionSummary], str | None]],
+        ] = {}
 
         if self.table_name:
             try:
@@ -284,6 +316,7 @@ class SessionService:
 
     async def create_session(self, name: str | None = None) -> Session:
         """Create a new session."""
+        self._invalidate_list_cache()
         session = Session(
             id=str(uuid.uuid4()),
             name=name or "New Session",
@@ -384,50 +417,113 @@ class SessionService:
         else:
             return self._local_sessions.get(session_id)
 
+    async def get_session_summary(self, session_id: str) -> SessionSummary | None:
+        """Get a session's metadata without loading its messages."""
+        if self._table:
+            try:
+                response = self._table.get_item(Key={"PK": f"SESSION#{session_id}", "SK": "META"})
+            except ClientError as e:
+                logger.error(f"Failed to get session from DynamoDB: {e}")
+                return None
+
+            item = response.get("Item")
+            if item is None:
+                return None
+
+            return SessionSummary(
+                id=item["id"],
+                name=item["name"],
+                created=datetime.fromisoformat(item["created"]),
+                updated=datetime.fromisoformat(item["updated"]),
+                message_count=int(item["message_count"]),
+                preview=item.get("preview", ""),
+            )
+        elif self._sqlite:
+            return self._sqlite.get_session_summary(session_id)
+        else:
+            session = self._local_sessions.get(session_id)
+            if session is None:
+                return None
+
+            return SessionSummary(
+                id=session.id,
+                name=session.name,
+                created=session.created,
+                updated=session.updated,
+                message_count=session.message_count,
+                preview=session.preview,
+            )
+
     async def list_sessions(
         self, limit: int = 20, cursor: str | None = None
     ) -> tuple[list[SessionSummary], str | None]:
-        """List sessions, most recent first."""
+        """List sessions, most recent first.
+
+        Results are cached for LIST_CACHE_TTL seconds per (limit, cursor) and
+        dropped whenever a session is created, changed or deleted.
+        """
+        key = (limit, cursor)
+        now = time.monotonic()
+        cached = self._list_cache.get(key)
+        if cached and cached[0] > now:
+            sessions, next_cursor = cached[1]
+            return list(sessions), next_cursor
+
+        try:
+            sessions, next_cursor = self._fetch_sessions(limit, cursor)
+        except ClientError as e:
+            logger.error(f"Failed to list sessions from DynamoDB: {e}")
+            return [], None
+
+        if len(self._list_cache) >= LIST_CACHE_MAX_ENTRIES:
+            self._list_cache.clear()
+        self._list_cache[key] = (now + LIST_CACHE_TTL, (sessions, next_cursor))
+        return list(sessions), next_cursor
+
+    def _invalidate_list_cache(self) -> None:
+        """Drop cached session listings after a change to any session."""
+        self._list_cache.clear()
+
+    def _fetch_sessions(
+        self, limit: int, cursor: str | None
+    ) -> tuple[list[SessionSummary], str | None]:
+        """Read a page of session summaries from the storage backend."""
         if self._table:
-            try:
-                query_params = {
-                    "IndexName": "GSI1",
-                    "KeyConditionExpression": Key("GSI1PK").eq("USER#default"),
-                    "ScanIndexForward": False,  # Descending order (most recent first)
-                    "Limit": limit,
-                }
+            query_params = {
+                "IndexName": "GSI1",
+                "KeyConditionExpression": Key("GSI1PK").eq("USER#default"),
+                "ScanIndexForward": False,  # Descending order (most recent first)
+                "Limit": limit,
+            }
 
-                if cursor:
-                    query_params["ExclusiveStartKey"] = {
-                        "GSI1PK": "USER#default",
-                        "GSI1SK": cursor,
-                        "PK": f"SESSION#{cursor.split('#')[1] if '#' in cursor else ''}",
-                        "SK": "META",
-                    }
+            if cursor:
+                query_params["ExclusiveStartKey"] = {
+                    "GSI1PK": "USER#default",
+                    "GSI1SK": cursor,
+                    "PK": f"SESSION#{cursor.split('#')[1] if '#' in cursor else ''}",
+                    "SK": "META",
+                }
 
-                response = self._table.query(**query_params)
-
-                sessions = []
-                for item in response.get("Items", []):
-                    sessions.append(
-                        SessionSummary(
-                            id=item["id"],
-                            name=item["name"],
-                            created=datetime.fromisoformat(item["created"]),
-                            updated=datetime.fromisoformat(item["updated"]),
-                            message_count=int(item["message_count"]),
-                            preview=item.get("preview", ""),
-                        )
+            response = self._table.query(**query_params)
+
+            sessions = []
+            for item in response.get("Items", []):
+                sessions.append(
+                    SessionSummary(
+                        id=item["id"],
+                        name=item["name"],
+                        created=datetime.fromisoformat(item["created"]),
+                        updated=datetime.fromisoformat(item["updated"]),
+                        message_count=int(item["message_count"]),
+                        preview=item.get("preview", ""),
                     )
+                )
 
-                next_cursor = None
-                if "LastEvaluatedKey" in response:
-                    next_cursor = response["LastEvaluatedKey"].get("GSI1SK")
+            next_cursor = None
+            if "LastEvaluatedKey" in response:
+                next_cursor = response["LastEvaluatedKey"].get("GSI1SK")
 
-                return sessions, next_cursor
-            except ClientError as e:
-                logger.error(f"Failed to list sessions from DynamoDB: {e}")
-                return [], None
+            return sessions, next_cursor
         elif self._sqlite:
             # SQLite persistence (no cursor support)
             return self._sqlite.list_sessions(limit), None
@@ -456,6 +552,7 @@ class SessionService:
         source: MessageSource = MessageSource.TEXT,
     ) -> SessionMessage:
         """Add a message to a session."""
+        self._invalidate_list_cache()
         timestamp = datetime.utcnow()
         message = SessionMessage(
             timestamp=timestamp,
@@ -545,24 +642,35 @@ class SessionService:
 
         return message
 
-    async def update_session_name(self, session_id: str, name: str) -> None:
-        """Update a session's name."""
+    async def update_session_name(self, session_id: str, name: str) -> bool:
+        """Update a session's name.
+
+        Returns False if the session doesn't exist, so callers don't need to
+        fetch it first just to return a 404.
+        """
+        self._invalidate_list_cache()
         if self._table:
             try:
                 self._table.update_item(
                     Key={"PK": f"SESSION#{session_id}", "SK": "META"},
                     UpdateExpression="SET #name = :name",
+                    ConditionExpression="attribute_exists(PK)",
                     ExpressionAttributeNames={"#name": "name"},
                     ExpressionAttributeValues={":name": name},
                 )
             except ClientError as e:
+                if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                    return False
                 logger.error(f"Failed to update session name: {e}")
                 raise
+            return True
         elif self._sqlite:
-            self._sqlite.update_session_name(session_id, name)
+            return self._sqlite.update_session_name(session_id, name)
         else:
-            if session_id in self._local_sessions:
-                self._local_sessions[session_id].name = name
+            if session_id not in self._local_sessions:
+                return False
+            self._local_sessions[session_id].name = name
+            return True
 
     async def add_artifact(self, session_id: str, artifact: SessionArtifact) -> None:
         """Track an artifact created during a session."""
@@ -630,6 +738,7 @@ class SessionService:
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session and all its messages."""
+        self._invalidate_list_cache()
         if self._table:
             try:
                 # Query all items for this session
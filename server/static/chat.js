@@ -0,0 +1,891 @@
+// Session Management State
+let currentSessionId = null;
+let sessions = [];
+
+// Voice State
+let room = null;
+let isConnected = false;
+let isListening = false;
+let isSpeaking = false;
+let isProcessing = false;
+let isMuted = false;
+let voiceActivatedMode = false;
+let audioContext = null;
+let localAudioTrack = null;
+let micSource = null;
+let silenceNode = null;
+let silenceWorkletReady = null;
+let analyser = null;
+let silenceCheckInterval = null;
+const SILENCE_WORKLET_URL = document.currentScript.dataset.silenceWorklet;
+const SILENCE_THRESHOLD = 0.01;
+const SILENCE_DURATION = 3500;
+
+// Data channel codecs are stateless, so one of each serves every message
+const textEncoder = new TextEncoder();
+const textDecoder = new TextDecoder();
+
+// File upload state
+let pendingFiles = [];
+
+// Elements
+const chat = document.getElementById('chat');
+const textInput = document.getElementById('textInput');
+const voiceBtn = document.getElementById('voiceBtn');
+const sendBtn = document.getElementById('sendBtn');
+const muteBtn = document.getElementById('muteBtn');
+const attachBtn = document.getElementById('attachBtn');
+const fileInput = document.getElementById('fileInput');
+const attachmentPreview = document.getElementById('attachmentPreview');
+const handsFreeToggle = document.getElementById('handsFreeToggle');
+const statusDot = document.getElementById('statusDot');
+const statusText = document.getElementById('statusText');
+const errorBanner = document.getElementById('errorBanner');
+const errorText = document.getElementById('errorText');
+const errorDismiss = document.getElementById('errorDismiss');
+const sessionsList = document.getElementById('sessionsList');
+const newSessionBtn = document.getElementById('newSessionBtn');
+const storageMode = document.getElementById('storageMode');
+const artifactsList = document.getElementById('artifactsList');
+const activityPanel = document.getElementById('activityPanel');
+const activityLog = document.getElementById('activityLog');
+const activityToggle = document.getElementById('activityToggle');
+
+// Activity tracking - visible by default
+let activityVisible = true;
+const MAX_ACTIVITY_ITEMS = 50;
+
+function showActivity() {
+    activityPanel.classList.add('visible');
+    activityVisible = true;
+    activityToggle.textContent = 'Hide';
+}
+
+function hideActivity() {
+    activityPanel.classList.remove('visible');
+    activityVisible = false;
+}
+
+function addActivity(type, text, icon = null) {
+    // Show panel when activity starts
+    if (!activityVisible) showActivity();
+
+    const time = new Date().toLocaleTimeString('en-US', { hour12: false, hour: '2-digit', minute: '2-digit', second: '2-digit' });
+    const iconMap = {
+        'thinking': '🧠',
+        'tool': '🔧',
+        'response': '💬',
+        'error': '❌',
+        'listening': '👂',
+        'speaking': '🔊',
+        'connected': '✅',
+        // Claude Code tool types
+        'search': '🔍',
+        'read': '📖',
+        'write': '✍️',
+        'edit': '✏️',
+        'code': '💻',
+        'agent': '🤖',
+        'notion': '📓',
+        'github': '🐙',
+    };
+    const displayIcon = icon || iconMap[type] || '•';
+
+    const item = document.createElement('div');
+    item.className = `activity-item ${type}`;
+    item.innerHTML = `
+        <span class="activity-time">${time}</span>
+        <span class="activity-icon">${displayIcon}</span>
+        <span class="activity-text">${escapeHtml(text)}</span>
+    `;
+
+    // Add to top of log
+    activityLog.insertBefore(item, activityLog.firstChild);
+
+    // Limit items
+    while (activityLog.children.length > MAX_ACTIVITY_ITEMS) {
+        activityLog.removeChild(activityLog.lastChild);
+    }
+}
+
+function clearActivity() {
+    activityLog.innerHTML = '';
+    hideActivity();
+}
+
+activityToggle.addEventListener('click', () => {
+    if (activityVisible) {
+        hideActivity();
+        activityToggle.textContent = 'Show';
+    } else {
+        showActivity();
+        activityToggle.textContent = 'Hide';
+    }
+});
+
+// ==================== Session Management ====================
+
+async function loadSessions() {
+    console.log('[Sessions] Loading sessions...');
+    sessionsList.innerHTML = '<div class="session-item" style="opacity: 0.5;">Loading...</div>';
+    try {
+        const resp = await fetch('/api/sessions');
+        console.log('[Sessions] API response status:', resp.status);
+        if (resp.ok) {
+            const data = await resp.json();
+            sessions = data.sessions || [];
+            console.log('[Sessions] Loaded', sessions.length, 'sessions:', JSON.stringify(sessions.slice(0, 2)));
+            renderSessions();
+
+            // Auto-create session if none exist
+            if (sessions.length === 0) {
+                console.log('[Sessions] No sessions found, auto-creating...');
+                await createSession();
+            } else if (!currentSessionId) {
+                // Auto-select first session
+                console.log('[Sessions] Selecting first session:', sessions[0].id);
+                selectSession(sessions[0].id);
+            }
+        } else {
+            const errorText = await resp.text();
+            console.error('[Sessions] Failed to load:', resp.status, errorText);
+            sessionsList.innerHTML = '<div class="session-item" style="color: #ef4444;">Failed to load sessions</div>';
+        }
+    } catch (e) {
+        console.error('[Sessions] Failed to load sessions:', e);
+        sessionsList.innerHTML = '<div class="session-item" style="color: #ef4444;">Error: ' + e.message + '</div>';
+    }
+}
+
+async function createSession() {
+    console.log('[Sessions] Creating new session...');
+    try {
+        const resp = await fetch('/api/sessions', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ name: 'New chat' })
+        });
+        if (resp.ok) {
+            const data = await resp.json();
+            console.log('[Sessions] Created session:', data.session);
+            currentSessionId = data.session.id;
+            sessions.unshift(data.session);  // Add to front of list
+            renderSessions();
+            clearChat();
+        } else {
+            console.error('[Sessions] Failed to create:', resp.status, await resp.text());
+        }
+    } catch (e) {
+        console.error('[Sessions] Failed to create session:', e);
+    }
+}
+
+async function selectSession(sessionId) {
+    currentSessionId = sessionId;
+    renderSessions();
+
+    try {
+        const resp = await fetch(`/api/sessions/${sessionId}`);
+        if (resp.ok) {
+            const session = await resp.json();
+            clearChat();
+
+            // Render messages
+            for (const msg of session.messages) {
+                addMessage(msg.content, msg.role, msg.source);
+            }
+
+            // Update artifacts
+            renderArtifacts(session.artifacts);
+
+            if (session.messages.length === 0) {
+                addMessage('Session loaded. Start chatting!', 'system');
+            }
+        }
+    } catch (e) {
+        console.error('Failed to load session:', e);
+    }
+}
+
+function renderSessions() {
+    console.log('[Sessions] Rendering', sessions.length, 'sessions, currentSessionId:', currentSessionId);
+    if (sessions.length === 0) {
+        sessionsList.innerHTML = '<div class="session-item" style="opacity: 0.5;">No sessions yet</div>';
+        return;
+    }
+    sessionsList.innerHTML = sessions.map(s => {
+        console.log('[Sessions] Rendering session:', s.id, s.name);
+        return `
+            <div class="session-item ${s.id === currentSessionId ? 'active' : ''}"
+                 onclick="selectSession('${s.id}')">
+                <div class="session-name">${escapeHtml(s.name || 'Untitled')}</div>
+                <div class="session-preview">${escapeHtml(s.preview || 'No messages')}</div>
+                <div class="session-time">${formatTime(s.updated || s.created)}</div>
+            </div>
+        `;
+    }).join('');
+    console.log('[Sessions] Rendered HTML length:', sessionsList.innerHTML.length);
+}
+
+function renderArtifacts(artifacts) {
+    if (!artifacts || artifacts.length === 0) {
+        artifactsList.innerHTML = '<div class="no-artifacts">No files in this session</div>';
+        return;
+    }
+    artifactsList.innerHTML = artifacts.map(a => `
+        <a class="artifact-item" href="/files/${a.path}" target="_blank">
+            <span class="artifact-icon">File</span>
+            <span class="artifact-name">${escapeHtml(a.path.split('/').pop())}</span>
+        </a>
+    `).join('');
+}
+
+async function checkStorageMode() {
+    try {
+        if (currentSessionId) {
+            const resp = await fetch(`/api/sessions/${currentSessionId}/storage-mode`);
+            if (resp.ok) {
+                const data = await resp.json();
+                storageMode.textContent = data.persistent ? 'DynamoDB' : 'In-memory (not saved)';
+                storageMode.className = 'storage-mode' + (data.persistent ? '' : ' in-memory');
+            }
+        }
+    } catch (e) {
+        storageMode.textContent = 'Unknown';
+    }
+}
+
+// ==================== Chat Functions ====================
+
+function clearChat() {
+    chat.innerHTML = '';
+}
+
+function addMessage(text, type, source = null, files = null) {
+    removeProcessing();
+    const msg = document.createElement('div');
+    msg.className = 'message ' + type;
+    if (source === 'voice') msg.classList.add('voice');
+
+    if (source) {
+        const label = document.createElement('span');
+        label.className = 'source-label';
+        label.textContent = source === 'voice' ? (type === 'user' ? 'You said:' : 'Blu says:') : '';
+        if (source === 'voice') msg.appendChild(label);
+    }
+
+    // Render markdown for assistant messages
+    if (type === 'assistant' && typeof marked !== 'undefined') {
+        const contentDiv = document.createElement('div');
+        contentDiv.className = 'message-content';
+        contentDiv.innerHTML = marked.parse(text);
+        msg.appendChild(contentDiv);
+    } else {
+        msg.appendChild(document.createTextNode(text));
+    }
+
+    // Add file attachment display if files were included
+    if (files && files.length > 0) {
+        const filesDiv = document.createElement('div');
+        filesDiv.className = 'file-attachments';
+        files.forEach(file => {
+            const chip = document.createElement('a');
+            chip.className = 'file-attachment-chip';
+            chip.href = file.url || '#';
+            chip.target = '_blank';
+            const icon = getFileIcon(file.name);
+            chip.innerHTML = `<span class="file-icon">${icon}</span>${file.name}`;
+            filesDiv.appendChild(chip);
+        });
+        msg.appendChild(filesDiv);
+    }
+
+    chat.appendChild(msg);
+    chat.scrollTop = chat.scrollHeight;
+    return msg;
+}
+
+function addProcessing(message = 'Thinking') {
+    removeProcessing();
+    isProcessing = true;
+    updateButtonState();
+    setStatus('processing', message + '...');
+    startThinkingAudio();  // Start audio feedback
+
+    const proc = document.createElement('div');
+    proc.className = 'processing-indicator';
+    proc.id = 'processing';
+    proc.innerHTML = `
+        <span class="brain-icon">🧠</span>
+        <span class="processing-text">${message}<span class="processing-dots"><span></span><span></span><span></span></span></span>
+    `;
+    chat.appendChild(proc);
+    chat.scrollTop = chat.scrollHeight;
+}
+
+function removeProcessing() {
+    const proc = document.getElementById('processing');
+    if (proc) proc.remove();
+    stopThinkingAudio();  // Stop audio feedback
+    if (isProcessing) {
+        isProcessing = false;
+        updateButtonState();
+        if (isConnected) setStatus('connected', 'Connected');
+    }
+}
+
+// ==================== Error Handling ====================
+
+function showError(message, autoDismiss = true) {
+    errorText.textContent = message;
+    errorBanner.classList.add('visible');
+    playErrorBeep();
+    if (autoDismiss) setTimeout(hideError, 10000);
+}
+
+function hideError() {
+    errorBanner.classList.remove('visible');
+}
+
+errorDismiss.addEventListener('click', hideError);
+
+// ==================== Audio ====================
+
+function getAudioContext() {
+    if (!audioContext) {
+        audioContext = new (window.AudioContext || window.webkitAudioContext)();
+    }
+    if (audioContext.state === 'suspended') audioContext.resume();
+    return audioContext;
+}
+
+function playBeep(freq, duration, type = 'sine') {
+    try {
+        const ctx = getAudioContext();
+        const osc = ctx.createOscillator();
+        const gain = ctx.createGain();
+        osc.type = type;
+        osc.frequency.value = freq;
+        gain.gain.value = 0.3;
+        osc.connect(gain);
+        gain.connect(ctx.destination);
+        osc.start();
+        gain.gain.exponentialRampToValueAtTime(0.01, ctx.currentTime + duration/1000);
+        osc.stop(ctx.currentTime + duration/1000);
+    } catch(e) { console.log('Audio error:', e); }
+}
+
+function playStartBeep() { playBeep(440, 100); setTimeout(() => playBeep(660, 100), 120); }
+function playStopBeep() { playBeep(660, 100); setTimeout(() => playBeep(440, 100), 120); }
+function playErrorBeep() { playBeep(220, 200, 'sawtooth'); }
+
+// Thinking audio indicator - very gentle tones while agent is processing
+let thinkingInterval = null;
+function playSoftTone(freq, duration) {
+    try {
+        const ctx = getAudioContext();
+        const osc = ctx.createOscillator();
+        const gain = ctx.createGain();
+        osc.type = 'sine';  // Softest waveform
+        osc.frequency.value = freq;
+        gain.gain.value = 0.08;  // Much quieter (was 0.3)
+        osc.connect(gain);
+        gain.connect(ctx.destination);
+        // Soft fade in/out for rounder sound
+        gain.gain.setValueAtTime(0, ctx.currentTime);
+        gain.gain.linearRampToValueAtTime(0.08, ctx.currentTime + 0.05);
+        gain.gain.exponentialRampToValueAtTime(0.001, ctx.currentTime + duration/1000);
+        osc.start();
+        osc.stop(ctx.currentTime + duration/1000);
+    } catch(e) { console.log('Audio error:', e); }
+}
+function playThinkingTone() {
+    // Very soft, rounded blips with longer delays
+    playSoftTone(280, 150);  // Lower frequency, longer duration
+    setTimeout(() => playSoftTone(320, 150), 400);  // Much longer delay (was 80ms)
+    setTimeout(() => playSoftTone(350, 150), 800);  // Even longer delay (was 160ms)
+}
+function startThinkingAudio() {
+    if (thinkingInterval) return;  // Already playing
+    playThinkingTone();  // Play immediately
+    thinkingInterval = setInterval(playThinkingTone, 4000);  // Repeat every 4 seconds (was 2)
+}
+function stopThinkingAudio() {
+    if (thinkingInterval) {
+        clearInterval(thinkingInterval);
+        thinkingInterval = null;
+    }
+}
+
+// ==================== Status ====================
+
+function setStatus(status, text) {
+    // Silence detection re-sends the same status while nothing changes; skip those writes
+    const className = 'status-dot ' + status;
+    if (statusDot.className !== className) statusDot.className = className;
+    if (statusText.textContent !== text) statusText.textContent = text;
+}
+
+function updateButtonState() {
+    voiceBtn.classList.remove('listening', 'speaking', 'processing');
+    if (isListening) voiceBtn.classList.add('listening');
+    else if (isSpeaking) voiceBtn.classList.add('speaking');
+    else if (isProcessing) voiceBtn.classList.add('processing');
+}
+
+// ==================== LiveKit Connection ====================
+
+async function connect() {
+    console.log('[Voice] Starting connection...');
+    setStatus('connecting', 'Connecting...');
+    try {
+        const resp = await fetch('/api/voice/token');
+        if (!resp.ok) throw new Error((await resp.json()).detail || 'Failed to get token');
+        const { token, url } = await resp.json();
+        console.log('[Voice] Got token, connecting to:', url);
+
+        room = new LivekitClient.Room({ adaptiveStream: true, dynacast: true });
+
+        room.on(LivekitClient.RoomEvent.Connected, () => {
+            console.log('[Voice] Connected to room');
+            isConnected = true;
+            setStatus('connected', 'Connected');
+            voiceBtn.disabled = false;
+            addMessage('Voice connected. Ready to talk!', 'system');
+        });
+
+        room.on(LivekitClient.RoomEvent.Disconnected, (reason) => {
+            isConnected = false;
+            isProcessing = false;
+            isSpeaking = false;
+            setStatus('error', 'Disconnected');
+            voiceBtn.disabled = true;
+            updateButtonState();
+            if (reason) showError('Disconnected: ' + reason);
+        });
+
+        room.on(LivekitClient.RoomEvent.Reconnecting, () => setStatus('connecting', 'Reconnecting...'));
+        room.on(LivekitClient.RoomEvent.Reconnected, () => {
+            setStatus('connected', 'Reconnected');
+            addMessage('Connection restored', 'system');
+        });
+
+        room.on(LivekitClient.RoomEvent.TrackSubscribed, (track) => {
+            if (track.kind === 'audio') {
+                const audio = track.attach();
+                audio.volume = 1.0;
+                document.body.appendChild(audio);
+                audio.onplay = () => { isSpeaking = true; updateButtonState(); setStatus('speaking', 'Speaking...'); };
+                audio.onended = audio.onpause = () => {
+                    isSpeaking = false;
+                    updateButtonState();
+                    if (isConnected && !isListening && !isProcessing) setStatus('connected', 'Connected');
+                };
+            }
+        });
+
+        room.on(LivekitClient.RoomEvent.DataReceived, (data) => {
+            try {
+                const msg = JSON.parse(textDecoder.decode(data));
+                console.log('DataReceived:', msg.type, msg);  // Debug logging
+                if (msg.type === 'transcript' && msg.role === 'user' && msg.is_final) {
+                    // User speech transcript
+                    console.log('Adding user transcript:', msg.text);
+                    addMessage(msg.text, 'user', 'voice');
+                    addProcessing('Thinking');
+                    addActivity('listening', 'Received: "' + msg.text.substring(0, 50) + (msg.text.length > 50 ? '..."' : '"'));
+                } else if (msg.type === 'transcript' && msg.role === 'assistant' && msg.is_final) {
+                    // Assistant response via transcript channel (voice responses)
+                    console.log('Adding assistant transcript:', msg.text);
+                    removeProcessing();
+                    addMessage(msg.text, 'assistant', 'voice');
+                    addActivity('response', 'Response ready (' + msg.text.length + ' chars)');
+                } else if (msg.type === 'response') {
+                    // Legacy response type (kept for compatibility)
+                    console.log('Adding assistant response:', msg.text);
+                    removeProcessing();
+                    addMessage(msg.text, 'assistant', 'voice');
+                    addActivity('response', 'Response ready (' + msg.text.length + ' chars)');
+                } else if (msg.type === 'agent_state') {
+                    console.log('Agent state change:', msg.state);  // Debug
+                    if (msg.state === 'thinking') {
+                        addProcessing('Thinking');
+                        addActivity('thinking', 'Processing request...');
+                    }
+                    else if (msg.state === 'speaking') {
+                        removeProcessing();
+                        setStatus('speaking', 'Speaking...');
+                        addActivity('speaking', 'Speaking response');
+                    }
+                    else if (msg.state === 'listening') {
+                        removeProcessing();
+                        setStatus('listening', 'Listening...');
+                    }
+                    else if (msg.state === 'idle') {
+                        removeProcessing();
+                        setStatus('connected', 'Connected');
+                    }
+                } else if (msg.type === 'activity') {
+                    // Custom activity messages from agent
+                    addActivity(msg.activity_type || 'tool', msg.message);
+                } else if (msg.type === 'error') {
+                    showError(msg.message || msg.error);
+                    addMessage(msg.message || msg.error, 'error');
+                    addActivity('error', msg.message || msg.error);
+                } else if (msg.type === 'system') {
+                    // System notification from agent (reconnections, skill updates, etc.)
+                    addMessage(msg.message, 'system');
+                    addActivity('connected', msg.message);
+                }
+            } catch(e) { console.log('Data parse error:', e); }
+        });
+
+        await room.connect(url, token);
+    } catch (error) {
+        console.error('Connection error:', error);
+        setStatus('error', 'Connection failed');
+        showError('Connection failed: ' + error.message);
+        setTimeout(connect, 5000);
+    }
+}
+
+// ==================== Voice Recording ====================
+
+async function startListening() {
+    if (isListening || !isConnected) return;
+    try {
+        localAudioTrack = await LivekitClient.createLocalAudioTrack({ echoCancellation: true, noiseSuppression: true });
+        await room.localParticipant.publishTrack(localAudioTrack);
+
+        const stream = localAudioTrack.mediaStream;
+        if (stream) await startSilenceDetection(stream);
+
+        isListening = true;
+        voiceBtn.classList.add('listening');
+        muteBtn.disabled = false;
+        playStartBeep();
+        setStatus('connected', 'Listening...');
+    } catch (error) {
+        console.error('Mic error:', error);
+        addMessage('Could not access microphone', 'error');
+        playErrorBeep();
+    }
+}
+
+async function startSilenceDetection(stream) {
+    const audioCtx = getAudioContext();
+    micSource = audioCtx.createMediaStreamSource(stream);
+
+    if (audioCtx.audioWorklet) {
+        // RMS is computed on the audio thread; the page only hears about changes
+        try {
+            if (!silenceWorkletReady) silenceWorkletReady = audioCtx.audioWorklet.addModule(SILENCE_WORKLET_URL);
+            await silenceWorkletReady;
+            silenceNode = new AudioWorkletNode(audioCtx, 'silence-detector', {
+                numberOfOutputs: 0,
+                processorOptions: { threshold: SILENCE_THRESHOLD },
+            });
+            silenceNode.port.onmessage = (e) => onSilenceChange(e.data.silentMs);
+            micSource.connect(silenceNode);
+            return;
+        } catch (e) {
+            console.log('Silence worklet unavailable, polling instead:', e);
+            silenceWorkletReady = null;
+        }
+    }
+
+    // Raw waveform bytes (centred on 128) are all a loudness check needs, no FFT
+    analyser = audioCtx.createAnalyser();
+    analyser.fftSize = 512;
+    micSource.connect(analyser);
+    const dataArray = new Uint8Array(analyser.fftSize);
+    let lastSoundTime = Date.now();
+
+    silenceCheckInterval = setInterval(() => {
+        if (!analyser) return;
+        analyser.getByteTimeDomainData(dataArray);
+        let sum = 0;
+        for (let i = 0; i < dataArray.length; i++) {
+            const d = dataArray[i] - 128;
+            sum += d < 0 ? -d : d;
+        }
+
+        if (sum / dataArray.length / 128 > SILENCE_THRESHOLD) lastSoundTime = Date.now();
+        onSilenceChange(Date.now() - lastSoundTime);
+    }, 100);
+}
+
+function onSilenceChange(silentFor) {
+    if (!isListening) return;
+    if (silentFor === 0) {
+        setStatus('connected', 'Listening...');
+        return;
+    }
+    if (silentFor > 1000) setStatus('connected', `Silent ${Math.floor(silentFor/1000)}s...`);
+    // Only auto-stop if NOT in hands-free mode
+    if (!voiceActivatedMode && silentFor >= SILENCE_DURATION) stopListening();
+}
+
+async function stopListening() {
+    if (!isListening) return;
+    isListening = false;
+    isMuted = false;
+    voiceBtn.classList.remove('listening');
+    muteBtn.disabled = true;
+    muteBtn.classList.remove('muted');
+    muteBtn.textContent = '🔇';
+    playStopBeep();
+    setStatus('connected', 'Connected');
+
+    if (silenceCheckInterval) { clearInterval(silenceCheckInterval); silenceCheckInterval = null; }
+    analyser = null;
+    if (silenceNode) {
+        silenceNode.port.onmessage = null;
+        silenceNode.port.postMessage('stop');
+        silenceNode.disconnect();
+        silenceNode = null;
+    }
+    if (micSource) { micSource.disconnect(); micSource = null; }
+
+    if (localAudioTrack) {
+        try {
+            await room.localParticipant.unpublishTrack(localAudioTrack);
+            localAudioTrack.stop();
+        } catch (e) { console.log('Error stopping track:', e); }
+        localAudioTrack = null;
+    }
+}
+
+function toggleListening() {
+    if (isListening) stopListening();
+    else startListening();
+}
+
+function toggleMute() {
+    if (!localAudioTrack || !isListening) return;
+    isMuted = !isMuted;
+    if (isMuted) {
+        localAudioTrack.mute();
+        muteBtn.classList.add('muted');
+        muteBtn.textContent = '🔊';
+        muteBtn.title = 'Unmute microphone';
+        setStatus('connected', 'Muted');
+    } else {
+        localAudioTrack.unmute();
+        muteBtn.classList.remove('muted');
+        muteBtn.textContent = '🔇';
+        muteBtn.title = 'Mute microphone';
+        setStatus('connected', 'Listening...');
+    }
+}
+
+// ==================== File Upload ====================
+
+function showFilePreview(file) {
+    const chip = document.createElement('div');
+    chip.className = 'attachment-chip';
+    const fileIcon = getFileIcon(file.name);
+    chip.innerHTML = `
+        <span>${fileIcon} ${file.name.length > 20 ? file.name.slice(0, 17) + '...' : file.name}</span>
+        <button onclick="removeFile('${file.name}')" title="Remove">&times;</button>
+    `;
+    attachmentPreview.appendChild(chip);
+}
+
+function getFileIcon(filename) {
+    const ext = filename.split('.').pop().toLowerCase();
+    const icons = {
+        'pdf': '📄', 'doc': '📝', 'docx': '📝', 'txt': '📄', 'md': '📄',
+        'xls': '📊', 'xlsx': '📊', 'csv': '📊',
+        'jpg': '🖼️', 'jpeg': '🖼️', 'png': '🖼️', 'gif': '🖼️', 'webp': '🖼️',
+        'json': '📋', 'xml': '📋', 'html': '🌐',
+    };
+    return icons[ext] || '📎';
+}
+
+function removeFile(fileName) {
+    pendingFiles = pendingFiles.filter(f => f.name !== fileName);
+    renderAttachmentPreview();
+}
+
+function renderAttachmentPreview() {
+    attachmentPreview.innerHTML = '';
+    if (pendingFiles.length > 0) {
+        pendingFiles.forEach(file => showFilePreview(file));
+        // Add hint about needing to press send
+        const hint = document.createElement('div');
+        hint.className = 'attachment-hint';
+        hint.textContent = '💡 Press Send to include files (voice input won\'t send attachments)';
+        attachmentPreview.appendChild(hint);
+    }
+}
+
+function clearAttachments() {
+    pendingFiles = [];
+    attachmentPreview.innerHTML = '';
+    fileInput.value = '';
+}
+
+async function uploadFiles(files) {
+    const uploadedUrls = [];
+    for (const file of files) {
+        const formData = new FormData();
+        formData.append('file', file);
+        if (currentSessionId) formData.append('session_id', currentSessionId);
+        try {
+            const resp = await fetch('/api/files/upload', {
+                method: 'POST',
+                body: formData
+            });
+            if (resp.ok) {
+                const data = await resp.json();
+                uploadedUrls.push({ name: file.name, url: data.url || data.path });
+            }
+        } catch (e) {
+            console.error('File upload failed:', file.name, e);
+        }
+    }
+    return uploadedUrls;
+}
+
+// ==================== Text Input ====================
+
+textInput.addEventListener('input', () => {
+    textInput.style.height = 'auto';
+    textInput.style.height = Math.min(textInput.scrollHeight, 120) + 'px';
+});
+
+textInput.addEventListener('keydown', (e) => {
+    if (e.key === 'Enter' && !e.shiftKey) { e.preventDefault(); sendText(); }
+});
+
+sendBtn.addEventListener('click', sendText);
+
+async function sendText() {
+    const text = textInput.value.trim();
+    if (!text && pendingFiles.length === 0) return;
+
+    // Upload files first if any
+    let uploadedFiles = [];
+    if (pendingFiles.length > 0) {
+        addProcessing('Uploading files...');
+        uploadedFiles = await uploadFiles(pendingFiles);
+        clearAttachments();
+    }
+
+    // Build message text (without file list - files shown as chips)
+    let messageText = text || (uploadedFiles.length > 0 ? 'Attached files for analysis' : '');
+
+    if (messageText) {
+        addMessage(messageText, 'user', null, uploadedFiles.length > 0 ? uploadedFiles : null);
+    }
+    textInput.value = '';
+    textInput.style.height = 'auto';
+
+    // Track message in session
+    if (currentSessionId) {
+        try {
+            const resp = await fetch(`/api/sessions/${currentSessionId}/messages`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ content: messageText, source: 'text', files: uploadedFiles })
+            });
+            if (resp.ok) {
+                const data = await resp.json();
+                if (data.session_name) {
+                    // Name was auto-generated, refresh sessions
+                    await loadSessions();
+                }
+            }
+        } catch (e) { console.error('Failed to track message:', e); }
+    }
+
+    if (isConnected && room) {
+        try {
+            room.localParticipant.publishData(
+                textEncoder.encode(JSON.stringify({ type: 'text', text: messageText, files: uploadedFiles })),
+                { reliable: true }
+            );
+            addProcessing('Processing');
+        } catch (e) {
+            console.error('Failed to send message:', e);
+            showError('Failed to send message');
+            removeProcessing();
+        }
+    } else {
+        showError('Not connected to voice service');
+        addMessage('Not connected to voice service', 'error');
+    }
+}
+
+// ==================== Utilities ====================
+
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+
+function formatTime(isoString) {
+    const date = new Date(isoString);
+    const now = new Date();
+    const diff = now - date;
+    if (diff < 60000) return 'Just now';
+    if (diff < 3600000) return `${Math.floor(diff / 60000)}m ago`;
+    if (diff < 86400000) return `${Math.floor(diff / 3600000)}h ago`;
+    return date.toLocaleDateString();
+}
+
+// ==================== Mobile Tabs ====================
+
+document.querySelectorAll('.mobile-tab').forEach(tab => {
+    tab.addEventListener('click', () => {
+        document.querySelectorAll('.mobile-tab').forEach(t => t.classList.remove('active'));
+        tab.classList.add('active');
+
+        const panel = tab.dataset.panel;
+        document.getElementById('sessionsSidebar').classList.toggle('mobile-visible', panel === 'sessions');
+        document.getElementById('chatMain').classList.toggle('hidden', panel !== 'chat');
+        document.getElementById('artifactsPanel').classList.toggle('mobile-visible', panel === 'artifacts');
+    });
+});
+
+// ==================== Event Listeners ====================
+
+voiceBtn.addEventListener('click', toggleListening);
+muteBtn.addEventListener('click', toggleMute);
+attachBtn.addEventListener('click', () => fileInput.click());
+fileInput.addEventListener('change', (e) => {
+    for (const file of e.target.files) {
+        pendingFiles.push(file);
+        showFilePreview(file);
+    }
+    fileInput.value = '';  // Reset to allow re-selecting same file
+});
+handsFreeToggle.addEventListener('change', (e) => {
+    voiceActivatedMode = e.target.checked;
+    if (voiceActivatedMode) {
+        addMessage('Hands-free mode enabled. Mic will stay open until you click stop.', 'system');
+    }
+});
+newSessionBtn.addEventListener('click', createSession);
+document.addEventListener('click', () => getAudioContext(), { once: true });
+document.addEventListener('touchstart', () => getAudioContext(), { once: true });
+
+// ==================== Initialize ====================
+
+async function init() {
+    console.log('[Init] Starting initialization...');
+    // Show activity panel by default
+    showActivity();
+    await loadSessions();
+    console.log('[Init] Sessions loaded, currentSessionId:', currentSessionId);
+    await checkStorageMode();
+    console.log('[Init] Storage mode checked');
+    connect();
+    console.log('[Init] Voice connection initiated');
+}
+
+init();
+console.log('[Init] init() called');
+
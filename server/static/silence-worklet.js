@@ -0,0 +1,43 @@
+// Silence detection for the microphone stream, run on the audio rendering thread.
+// Computes RMS per render quantum and only messages the page when the state
+// changes: {silentMs: 0} once sound resumes, then {silentMs} every
+// REPORT_INTERVAL_MS while it stays quiet.
+const REPORT_INTERVAL_MS = 500;
+
+class SilenceDetector extends AudioWorkletProcessor {
+    constructor(options) {
+        super();
+        this.threshold = options.processorOptions.threshold;
+        this.silentFrames = 0;
+        this.reported = 0;
+        this.active = true;
+        // The page posts 'stop' when it is done listening so the processor can be released
+        this.port.onmessage = () => { this.active = false; };
+    }
+
+    process(inputs) {
+        if (!this.active) return false;
+        const samples = inputs[0][0];
+        if (!samples) return true;
+
+        let sum = 0;
+        for (let i = 0; i < samples.length; i++) sum += samples[i] * samples[i];
+
+        if (Math.sqrt(sum / samples.length) > this.threshold) {
+            if (this.silentFrames > 0) this.port.postMessage({ silentMs: 0 });
+            this.silentFrames = 0;
+            this.reported = 0;
+        } else {
+            this.silentFrames += samples.length;
+            const silentMs = (this.silentFrames / sampleRate) * 1000;
+            const step = Math.floor(silentMs / REPORT_INTERVAL_MS);
+            if (step > this.reported) {
+                this.reported = step;
+                this.port.postMessage({ silentMs });
+            }
+        }
+        return true;
+    }
+}
+
+registerProcessor('silence-detector', SilenceDetector);
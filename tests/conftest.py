@@ -31,7 +31,7 @@ def test_settings(temp_workspace: Path):
 
     os.environ["WORKSPACE_PATH"] = str(temp_workspace)
     # Create a valid bcrypt hash for 'testpass'
-    password_hash = bcrypt.hashpw(b"testpass", bcrypt.gensalt()).decode("utf-8")
+    password_hash = bcrypt.hashpw(b"testpass", bcrypt.gensalt(rounds=4)).decode("utf-8")
     os.environ["AUTH_PASSWORD_HASH"] = password_hash
 
     from server.config import get_settings
@@ -1,8 +1,13 @@
 """Unit tests for the auth service and endpoints."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from fastapi.testclient import TestClient
 
+from server.services import auth as auth_module
 from server.services.auth import AuthService, hash_password
 
 
@@ -12,7 +17,8 @@ class TestAuthService:
     @pytest.fixture
     def auth_service(self):
         """Create an AuthService with a known password."""
-        password_hash = hash_password("testpassword")
+        # Minimum work factor keeps every bcrypt check in these tests fast
+        password_hash = hash_password("testpassword", rounds=4)
         return AuthService(
             password_hash=password_hash,
             session_secret="testsecret",
@@ -76,12 +82,84 @@ class TestAuthService:
         success, result = auth_service.check_password("wrong", ip)
         assert f"{auth_service.max_attempts - 1} attempts remaining" in result
 
+    def test_concurrent_wrong_passwords_limited(self, auth_service: AuthService, monkeypatch):
+        """Test parallel guesses from one IP can't run more bcrypt checks than the limit."""
+        calls = []
+        lock = threading.Lock()
+
+        def slow_checkpw(password, hashed):
+            with lock:
+                calls.append(password)
+            time.sleep(0.05)
+            return False
+
+        monkeypatch.setattr("server.services.auth.bcrypt.checkpw", slow_checkpw)
+        with ThreadPoolExecutor(max_workers=30) as pool:
+            results = list(
+                pool.map(lambda _: auth_service.check_password("wrong", "10.1.1.1"), range(30))
+            )
+
+        assert len(calls) <= auth_service.max_attempts
+        assert all(success is False for success, _ in results)
+        assert auth_service.is_locked("10.1.1.1")[0] is True
+
+    def test_correct_password_releases_reservation(self, auth_service: AuthService):
+        """Test a successful check leaves no attempt counted against the IP."""
+        assert auth_service.check_password("testpassword", "10.1.1.2")[0] is True
+
+        attempt = auth_service._attempts["10.1.1.2"]
+        assert (attempt.attempts, attempt.pending) == (0, 0)
+
+    def test_repeat_login_skips_bcrypt(self, auth_service: AuthService, monkeypatch):
+        """Test a previously verified password is accepted without re-running bcrypt."""
+        assert auth_service.check_password("testpassword", "127.0.0.1")[0] is True
+
+        calls = []
+        monkeypatch.setattr(
+            "server.services.auth.bcrypt.checkpw", lambda *args: calls.append(args) or False
+        )
+        assert auth_service.check_password("testpassword", "127.0.0.1")[0] is True
+        assert calls == []
+
+        # Anything else still goes through bcrypt
+        assert auth_service.check_password("wrongpassword", "127.0.0.1")[0] is False
+        assert len(calls) == 1
+
     def test_session_creation(self, auth_service: AuthService):
         """Test session token is created on successful login."""
         success, token = auth_service.check_password("testpassword", "127.0.0.1")
         assert success is True
         assert auth_service.verify_session(token) is True
 
+    def test_attempt_tracking_is_bounded(self, auth_service: AuthService, monkeypatch):
+        """Test the least recently seen IP is forgotten once the table is full."""
+        monkeypatch.setattr(auth_module, "MAX_TRACKED_IPS", 2)
+        for ip in ("10.0.0.1", "10.0.0.2"):
+            auth_service.is_locked(ip)
+        auth_service.is_locked("10.0.0.1")
+        auth_service.is_locked("10.0.0.3")
+
+        assert list(auth_service._attempts) == ["10.0.0.1", "10.0.0.3"]
+
+    def test_expired_sessions_swept_on_login(self, auth_service: AuthService, monkeypatch):
+        """Test expired sessions are dropped periodically even if never presented again."""
+        monkeypatch.setattr(auth_module, "SESSION_SWEEP_INTERVAL", 2)
+        auth_service._sessions["stale"] = 0.0
+        _, live = auth_service.check_password("testpassword", "127.0.0.1")
+        _, newest = auth_service.check_password("testpassword", "127.0.0.1")
+
+        assert set(auth_service._sessions) == {live, newest}
+
+    def test_sweep_counts_logins_not_table_size(self, auth_service: AuthService, monkeypatch):
+        """Test the sweep still runs when logouts keep the table size off the interval."""
+        monkeypatch.setattr(auth_module, "SESSION_SWEEP_INTERVAL", 2)
+        auth_service._sessions["stale"] = 0.0
+        for _ in range(2):
+            _, token = auth_service.check_password("testpassword", "127.0.0.1")
+            auth_service.invalidate_session(token)
+
+        assert "stale" not in auth_service._sessions
+
     def test_session_verification_invalid(self, auth_service: AuthService):
         """Test invalid session tokens are rejected."""
         assert auth_service.verify_session("invalid_token") is False
@@ -124,6 +202,10 @@ class TestHashPassword:
         hash2 = hash_password("mypassword")
         assert hash1 != hash2
 
+    def test_hash_password_rounds(self):
+        """Test the work factor is encoded in the hash."""
+        assert hash_password("mypassword", rounds=4).startswith("$2b$04$")
+
 
 class TestAuthEndpoints:
     """Tests for auth-related API endpoints."""
@@ -155,6 +237,13 @@ class TestAuthEndpoints:
         assert response.status_code == 200
         assert "Invalid password" in response.text
 
+    def test_login_page_escapes_error(self, client: TestClient):
+        """Test the login error message is HTML-escaped."""
+        response = client.get("/login", params={"error": "<script>alert(1)</script>"})
+        assert response.status_code == 200
+        assert "<script>alert(1)</script>" not in response.text
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in response.text
+
     def test_logout_clears_session(self, authenticated_client: TestClient):
         """Test logout clears session."""
         # Should be able to access protected page
@@ -0,0 +1,87 @@
+"""Unit tests for the chat handler's in-memory session tracking."""
+
+import asyncio
+
+import pytest
+
+from server.handlers import chat
+
+
+@pytest.fixture(autouse=True)
+def clear_sessions():
+    """Start each test with an empty session table."""
+    chat._active_sessions.clear()
+    yield
+    chat._active_sessions.clear()
+
+
+class TestSessionTracking:
+    """Tests for registering, expiring and sweeping chat sessions."""
+
+    def test_unknown_session_is_not_existing(self):
+        """Test an unregistered session ID is treated as new."""
+        assert chat._is_existing_session("missing") is False
+
+    def test_registered_session_is_existing(self):
+        """Test a registered session can be resumed."""
+        chat._register_session("abc", is_new=True)
+        assert chat._is_existing_session("abc") is True
+
+    def test_expired_session_is_removed(self):
+        """Test a session past its TTL is treated as new and dropped."""
+        chat._register_session("abc")
+        chat._active_sessions["abc"].last_used -= chat.SESSION_TTL_NS + 1
+
+        assert chat._is_existing_session("abc") is False
+        assert "abc" not in chat._active_sessions
+
+    def test_register_moves_stale_session_to_end(self):
+        """Test re-registering a stale session moves it to the back of the LRU order."""
+        chat._register_session("first")
+        chat._register_session("second")
+        chat._active_sessions["first"].last_used -= chat.TOUCH_INTERVAL_NS
+
+        chat._register_session("first")
+        assert list(chat._active_sessions) == ["second", "first"]
+
+    def test_cleanup_stops_at_first_live_session(self):
+        """Test cleanup pops expired sessions from the front only."""
+        for sid in ("old", "live"):
+            chat._register_session(sid)
+        chat._active_sessions["old"].last_used -= chat.SESSION_TTL_NS + 1
+
+        chat._cleanup_expired_sessions()
+        assert list(chat._active_sessions) == ["live"]
+
+
+class TestProcessTracking:
+    """Tests for the capped table of running CLI processes."""
+
+    def test_evicted_process_cancellation_is_kept_alive(self, monkeypatch):
+        """Test eviction holds a reference to its cancel task until it completes."""
+        monkeypatch.setattr(chat, "MAX_ACTIVE_PROCESSES", 1)
+        cancelled = []
+
+        class FakeProcess:
+            process = None
+
+            async def cancel(self):
+                cancelled.append(self)
+
+        async def run():
+            old = FakeProcess()
+            chat._track_process("old", old)
+            chat._track_process("new", FakeProcess())
+
+            assert list(chat._active_processes) == ["new"]
+            assert len(chat._eviction_tasks) == 1
+            await asyncio.gather(*chat._eviction_tasks)
+            return old
+
+        try:
+            old = asyncio.run(run())
+        finally:
+            chat._active_processes.clear()
+
+        assert cancelled == [old]
+        assert chat._eviction_tasks == set()
@@ -0,0 +1,75 @@
+"""Unit tests for the text helpers in the Claude Code LLM plugin."""
+
+import pytest
+
+# The plugin module imports livekit-agents - skip tests if not available
+try:
+    from server.services.claude_code_llm import chunk_text_for_tts, strip_markdown_for_speech
+
+    HAS_LIVEKIT = True
+except ImportError:
+    HAS_LIVEKIT = False
+
+pytestmark = pytest.mark.skipif(not HAS_LIVEKIT, reason="livekit-agents not installed")
+
+
+class TestStripMarkdownForSpeech:
+    """Tests for markdown removal before TTS."""
+
+    def test_plain_text_unchanged(self):
+        """Test text without markdown passes through."""
+        assert strip_markdown_for_speech("Hello there. How are you?") == (
+            "Hello there. How are you?"
+        )
+
+    def test_emphasis_and_code_removed(self):
+        """Test emphasis markers and inline code keep their content."""
+        text = "This is **bold**, *italic*, __strong__, _em_ and `code`."
+        assert strip_markdown_for_speech(text) == "This is bold, italic, strong, em and code."
+
+    def test_code_block_replaced(self):
+        """Test fenced code blocks are replaced with a placeholder."""
+        text = "Run this:\n```python\nprint('hi')\n```\nDone."
+        assert strip_markdown_for_speech(text) == "Run this:\n[code block]\nDone."
+
+    def test_links_urls_and_citations_removed(self):
+        """Test links keep their text while URLs and citations are dropped."""
+        text = "See [the docs](docs/setup.md) [1] or https://example.org [Source: web]."
+        assert strip_markdown_for_speech(text) == "See the docs or ."
+
+    def test_sources_section_removed(self):
+        """Test a trailing Sources section is dropped entirely."""
+        text = "It will rain today.\n\nSources:\n- https://weather.example\n- Another"
+        assert strip_markdown_for_speech(text) == "It will rain today."
+
+    def test_block_markers_removed(self):
+        """Test headers, rules, list markers and quotes are stripped per line."""
+        text = "# Title\n---\n- one\n2. two\n> quoted"
+        assert strip_markdown_for_speech(text) == "Title\none\ntwo\nquoted"
+
+
+class TestChunkTextForTTS:
+    """Tests for splitting speech into TTS-sized chunks."""
+
+    def test_short_text_single_chunk(self):
+        """Test text under the limit is returned as one chunk."""
+        assert chunk_text_for_tts("Hi there.", max_chars=50) == ["Hi there."]
+
+    def test_blank_text_no_chunks(self):
+        """Test whitespace-only text produces no chunks."""
+        assert chunk_text_for_tts("   ", max_chars=50) == []
+
+    def test_splits_on_sentences(self):
+        """Test chunks break at sentence boundaries within the limit."""
+        text = "One two three. Four five six! Seven eight nine? Ten."
+        assert chunk_text_for_tts(text, max_chars=30) == [
+            "One two three. Four five six!",
+            "Seven eight nine? Ten.",
+        ]
+
+    def test_long_sentence_split_on_words(self):
+        """Test a sentence longer than the limit falls back to word boundaries."""
+        text = "alpha beta gamma delta epsilon zeta eta theta."
+        chunks = chunk_text_for_tts(text, max_chars=20)
+        assert chunks == ["alpha beta gamma", "delta epsilon zeta", "eta theta."]
+        assert all(len(chunk) <= 20 for chunk in chunks)
@@ -1,10 +1,14 @@
 """Unit tests for the files handler."""
 
 import io
+import os
+import time
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 
+from server.handlers import files as files_module
+
 
 class TestListFiles:
     """Tests for the file listing endpoint."""
@@ -46,6 +50,23 @@ class TestListFiles:
         data = response.json()
         assert len(data) == 1
         assert data[0]["name"] == "nested.txt"
+        assert data[0]["path"] == "subdir/nested.txt"
+
+    def test_cached_listing_sees_new_files(self, client: TestClient, temp_workspace: Path):
+        """Test a cached listing is dropped once the directory's mtime changes."""
+        listing_dir = temp_workspace / "files" / "cached_listing"
+        listing_dir.mkdir()
+        (listing_dir / "first.txt").write_text("first")
+        # Backdate the directory so its listing is eligible for caching
+        os.utime(listing_dir, (time.time() - 60, time.time() - 60))
+
+        response = client.get("/files?path=cached_listing")
+        assert [f["name"] for f in response.json()] == ["first.txt"]
+        assert str(listing_dir.resolve()) in files_module._listing_cache
+
+        (listing_dir / "second.txt").write_text("second")
+        response = client.get("/files?path=cached_listing")
+        assert [f["name"] for f in response.json()] == ["first.txt", "second.txt"]
 
     def test_list_nonexistent_path(self, client: TestClient):
         """Test listing a nonexistent path returns 404."""
@@ -57,6 +78,15 @@ class TestListFiles:
         response = client.get("/files?path=../etc")
         assert response.status_code in [400, 403]
 
+    def test_sibling_prefix_directory_blocked(self, client: TestClient, temp_workspace: Path):
+        """Test that a sibling sharing the root's name prefix is not treated as inside it."""
+        sibling = temp_workspace / "files_evil"
+        sibling.mkdir(exist_ok=True)
+        (sibling / "secret.txt").write_text("secret")
+
+        response = client.get("/files?path=../files_evil")
+        assert response.status_code == 403
+
 
 class TestDownloadFile:
     """Tests for file download endpoint."""
@@ -72,6 +102,31 @@ class TestDownloadFile:
         assert response.status_code == 200
         assert response.content == b"download content"
 
+    def test_download_unchanged_file_not_modified(self, client: TestClient, temp_workspace: Path):
+        """Test a matching If-None-Match or If-Modified-Since returns 304 with no body."""
+        (temp_workspace / "files" / "cached.txt").write_text("cached content")
+
+        first = client.get("/files/cached.txt")
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        last_modified = first.headers["last-modified"]
+
+        response = client.get("/files/cached.txt", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = client.get("/files/cached.txt", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+
+    def test_download_changed_file_returns_content(self, client: TestClient, temp_workspace: Path):
+        """Test a stale ETag gets the full file back."""
+        (temp_workspace / "files" / "cached.txt").write_text("cached content")
+
+        response = client.get("/files/cached.txt", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.content == b"cached content"
+
     def test_download_nonexistent_file(self, client: TestClient):
         """Test downloading a nonexistent file returns 404."""
         response = client.get("/files/nonexistent.txt")
@@ -114,6 +169,7 @@ class TestUploadFile:
         data = response.json()
         assert data["success"] is True
         assert data["filename"] == "uploaded.txt"
+        assert data["size"] == len(b"uploaded content")
 
         # Verify file exists
         uploaded_file = temp_workspace / "files" / "uploaded.txt"
@@ -135,6 +191,18 @@ class TestUploadFile:
         # Should be renamed to duplicate_1.txt
         assert data["filename"] == "duplicate_1.txt"
 
+    def test_upload_filename_cannot_escape_directory(
+        self, authenticated_client: TestClient, temp_workspace: Path
+    ):
+        """Test that directory components in the uploaded filename are dropped."""
+        files = {"file": ("../escaped.txt", io.BytesIO(b"content"), "text/plain")}
+        response = authenticated_client.post("/files/upload", files=files)
+
+        assert response.status_code == 200
+        assert response.json()["path"] == "escaped.txt"
+        assert (temp_workspace / "files" / "escaped.txt").exists()
+        assert not (temp_workspace / "escaped.txt").exists()
+
 
 class TestCreateFolder:
     """Tests for folder creation endpoint."""
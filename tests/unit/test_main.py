@@ -0,0 +1,62 @@
+"""Unit tests for the index page served by the main app."""
+
+import gzip
+
+from fastapi.testclient import TestClient
+
+from server import main
+
+
+class TestAcceptsGzip:
+    """Tests for Accept-Encoding negotiation."""
+
+    def test_gzip_listed(self):
+        """Test a plain or weighted gzip entry is accepted."""
+        assert main._accepts_gzip("gzip, deflate, br") is True
+        assert main._accepts_gzip("br;q=1.0, gzip;q=0.8") is True
+
+    def test_gzip_refused_with_q_zero(self):
+        """Test gzip;q=0 is a refusal even though gzip is named."""
+        assert main._accepts_gzip("gzip;q=0, identity") is False
+        assert main._accepts_gzip("GZIP; q=0.000") is False
+
+    def test_wildcard(self):
+        """Test * allows gzip unless gzip itself is refused."""
+        assert main._accepts_gzip("*") is True
+        assert main._accepts_gzip("gzip;q=0, *") is False
+        assert main._accepts_gzip("*;q=0") is False
+
+    def test_missing_header(self):
+        """Test no Accept-Encoding means identity only."""
+        assert main._accepts_gzip("") is False
+
+
+class TestIndexEncoding:
+    """Tests for the prebuilt (production) index page bodies."""
+
+    def _use_prebuilt(self, monkeypatch) -> bytes:
+        html = b"<html>index</html>"
+        monkeypatch.setattr(main, "_INDEX_HTML", html)
+        monkeypatch.setattr(main, "_INDEX_ETAG", '"abc"')
+        monkeypatch.setattr(main, "_INDEX_GZIP", gzip.compress(html))
+        monkeypatch.setattr(main, "_INDEX_GZIP_ETAG", '"abc-gzip"')
+        return html
+
+    def test_gzip_refused_gets_identity(self, authenticated_client: TestClient, monkeypatch):
+        """Test a client refusing gzip with q=0 gets the uncompressed page."""
+        html = self._use_prebuilt(monkeypatch)
+
+        response = authenticated_client.get("/", headers={"Accept-Encoding": "gzip;q=0, identity"})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] == '"abc"'
+        assert response.content == html
+
+    def test_gzip_accepted_gets_compressed(self, authenticated_client: TestClient, monkeypatch):
+        """Test a client accepting gzip gets the precompressed page."""
+        html = self._use_prebuilt(monkeypatch)
+
+        response = authenticated_client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == '"abc-gzip"'
+        assert response.content == html
@@ -0,0 +1,34 @@
+"""Unit tests for the session list endpoint's HTTP caching."""
+
+from fastapi.testclient import TestClient
+
+
+class TestListSessionsCaching:
+    """Tests for ETag revalidation of the session list."""
+
+    def test_list_must_revalidate(self, authenticated_client: TestClient):
+        """Test the listing is never reused by the browser without revalidating."""
+        response = authenticated_client.get("/api/sessions")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "private, no-cache"
+        assert "sessions" in response.json()
+
+    def test_unchanged_list_not_modified(self, authenticated_client: TestClient):
+        """Test a matching If-None-Match returns 304 with no body."""
+        etag = authenticated_client.get("/api/sessions").headers["etag"]
+
+        response = authenticated_client.get("/api/sessions", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_rename_changes_etag(self, authenticated_client: TestClient):
+        """Test renaming a session invalidates a previously cached listing."""
+        session_id = authenticated_client.post("/api/sessions", json={}).json()["session"]["id"]
+        etag = authenticated_client.get("/api/sessions").headers["etag"]
+
+        authenticated_client.patch(f"/api/sessions/{session_id}", json={"name": "Renamed"})
+        response = authenticated_client.get("/api/sessions", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        names = [s["name"] for s in response.json()["sessions"]]
+        assert "Renamed" in names